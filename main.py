@@ -44,7 +44,7 @@ from pysioviz.components.data import (
 )
 from pysioviz.utils.sync_utils import add_alignment_info, extract_refticks_from_cameras
 from pysioviz.utils.gui_utils import app
-from pysioviz.utils.types import GlobalVariableId, GroundTruthLabel, CameraConfig, HwAccelEnum
+from pysioviz.utils.types import Annotation, GlobalVariableId, GroundTruthLabel, CameraConfig, HwAccelEnum
 
 # ============================================================================
 # CONFIGURATION
@@ -121,10 +121,12 @@ shared_stores = [
     ),  # Inter-modality synchronized `toa_s` timeline for reliable retrieval
     dcc.Store(id='fine-slider-window', data=250),
     dcc.Store(id='fine-slider-center', data=0),
+    dcc.Store(id='fine-slider-debounced', data=None),  # Fine slider position while dragging, throttled in the browser
     dcc.Store(id='controls-visible', data=True),
     # Annotation stores
     dcc.Store(id='annotations-store', data=[]),
-    dcc.Store(id='annotation-expanded', data={}),
+    dcc.Store(id='annotation-expanded', data=[]),
+    dcc.Store(id='annotations-load-trigger', data=0),  # Bumped only when annotations are loaded from file
     dcc.Store(id='active-input', data=None),
     dcc.Store(id='delete-target', data=None),
     # Offset stores
@@ -133,6 +135,7 @@ shared_stores = [
     # Event stores
     dcc.Store(id='keyboard-event', data=None),
     dcc.Store(id='feedback-message', data=None),
+    dcc.Store(id='session-id', data=None),  # Random ID of this page load, keys per-page caches on the server
     # Hidden div to trigger keyboard setup
     html.Div(id='keyboard-setup-trigger', style={'display': 'none'}),
     # Dummy output for callbacks that don't need real output
@@ -576,12 +579,10 @@ if __name__ == '__main__':
     )
     def handle_all_clicks(*args):
         """Centralized handler for click events from all components."""
-        ctx = callback_context
-        if not ctx.triggered:
-            return ''
-
         # Get which component was clicked
-        trigger_id = ctx.triggered[0]['prop_id'].split('.')[0]
+        trigger_id = callback_context.triggered_id
+        if trigger_id is None:
+            return ''
 
         # Get the current frame and sync timestamp from states
         ref_frame_timestamp = args[-2]
@@ -594,23 +595,26 @@ if __name__ == '__main__':
     # Fix for the annotation display update callback
     # This is necessary to ensure the annotation UI refreshes when annotations are loaded from file
     # Without this, loaded annotations would be in the store but not visible
+    # Edits render their own cards, so only loading (not every store write) triggers the full re-render
     @app.callback(
         Output('annotations-container', 'children', allow_duplicate=True),
         Output('annotation-counter', 'children', allow_duplicate=True),
-        Input('annotations-store', 'data'),
+        Input('annotations-load-trigger', 'data'),
+        State('annotations-store', 'data'),
         State('annotation-expanded', 'data'),
+        State('session-id', 'data'),
         prevent_initial_call=True,
     )
-    def update_annotations_display_fix(annotations_data: list[dict], expanded_state):
-        """Update the annotations display when store changes (e.g., after loading)"""
-        if annotations_data is None:
-            annotations_data = []
-        if expanded_state is None:
-            expanded_state = {}
+    def update_annotations_display_fix(
+        load_trigger: int, annotations_data: list[dict], expanded_ids: list[int] | None, session_id: str | None
+    ):
+        """Update the annotations display after loading them from file"""
+        annotation_list = [Annotation.from_dict(data) for data in annotations_data or ()]
+        expanded_state = set(expanded_ids or ())
 
         # Use the annotation component's method to create cards
-        annotation_cards = annotations._create_annotation_cards(annotations_data, expanded_state)
-        counter_text = f'Total: {len(annotations_data)} annotations'
+        annotation_cards = annotations._create_annotation_cards(annotation_list, expanded_state, session_id)
+        counter_text = f'Total: {len(annotation_list)} annotations'
         return annotation_cards, counter_text
 
     # ============================================================================
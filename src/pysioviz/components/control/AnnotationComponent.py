@@ -25,15 +25,40 @@
 #
 # ############
 
-import json
+from bisect import bisect_right
+from collections import OrderedDict
+from functools import lru_cache
+from operator import attrgetter
+from threading import Lock
 
-from dash import html, dcc, Input, Output, State, callback_context, ALL
+from dash import html, dcc, Input, Output, State, Patch, callback_context, no_update, ALL, MATCH
 import dash_bootstrap_components as dbc
 import numpy as np
 
 from pysioviz.components.control import ControlComponent
 from pysioviz.utils.gui_utils import app
-from pysioviz.utils.types import GlobalVariableId, GroundTruthLabel, InputId, TaskType, TriggerId
+from pysioviz.utils.types import (
+    Annotation,
+    AnnotationCardCache,
+    GlobalVariableId,
+    GroundTruthLabel,
+    InputId,
+    TaskType,
+    TriggerId,
+)
+
+# Styles shared by reference between all rendered annotation cards (never mutate).
+EXPAND_BTN_STYLE = {'width': '25px', 'height': '25px', 'padding': '0', 'lineHeight': '1', 'fontSize': '12px'}
+EDIT_BTN_STYLE = {'width': '25px', 'height': '25px', 'padding': '0', 'marginRight': '5px'}
+DELETE_BTN_STYLE = {'width': '25px', 'height': '25px', 'padding': '0'}
+TIME_BTN_STYLE = {'width': '100%'}
+TIME_ROW_STYLE = {'marginLeft': '0', 'marginRight': '0'}
+EDIT_CARD_STYLE = {'backgroundColor': '#f8f9fa'}
+VISIBLE_STYLE = {}
+HIDDEN_STYLE = {'display': 'none'}
+
+# Number of browser pages (tabs, reloads) whose rendered annotation cards are kept on the server.
+MAX_CARD_CACHE_SESSIONS = 8
 
 
 class AnnotationComponent(ControlComponent):
@@ -55,6 +80,14 @@ class AnnotationComponent(ControlComponent):
         self._annotation_values = [opt.value for opt in annotation_options]
         self._combined_timestamps = combined_timestamps
         self._combined_toas = combined_toas
+        # The merged `toa_s` are concatenated per camera, so they are binary searched through their stable sort order.
+        self._toa_order = np.argsort(combined_toas, kind='stable')
+        self._sorted_toas = combined_toas[self._toa_order]
+        # Rendered cards of each browser page by its session ID, the least recently used pages are dropped first.
+        self._card_caches: OrderedDict[str | None, AnnotationCardCache] = OrderedDict()
+        self._card_caches_lock = Lock()
+        # Frame IDs of recently converted annotation timestamp strings.
+        self._toa_str_to_global_frame = lru_cache(maxsize=4096)(self._get_toa_str_global_frame)
         super().__init__(unique_id='annotation_panel')
 
     def _create_layout(self):
@@ -146,7 +179,7 @@ class AnnotationComponent(ControlComponent):
                                                                         id=TriggerId.TASK_START_START.value,
                                                                         color='secondary',
                                                                         size='sm',
-                                                                        style={'width': '100%'},
+                                                                        style=TIME_BTN_STYLE,
                                                                     )
                                                                 ],
                                                                 width=2,
@@ -169,7 +202,7 @@ class AnnotationComponent(ControlComponent):
                                                                         id=TriggerId.TASK_START_END.value,
                                                                         color='secondary',
                                                                         size='sm',
-                                                                        style={'width': '100%'},
+                                                                        style=TIME_BTN_STYLE,
                                                                     )
                                                                 ],
                                                                 width=2,
@@ -187,10 +220,7 @@ class AnnotationComponent(ControlComponent):
                                                             ),
                                                         ],
                                                         className='mb-2',
-                                                        style={
-                                                            'marginLeft': '0',
-                                                            'marginRight': '0',
-                                                        },
+                                                        style=TIME_ROW_STYLE,
                                                     ),
                                                 ]
                                             ),
@@ -210,7 +240,7 @@ class AnnotationComponent(ControlComponent):
                                                                         id=TriggerId.TASK_END_START.value,
                                                                         color='secondary',
                                                                         size='sm',
-                                                                        style={'width': '100%'},
+                                                                        style=TIME_BTN_STYLE,
                                                                     )
                                                                 ],
                                                                 width=2,
@@ -233,7 +263,7 @@ class AnnotationComponent(ControlComponent):
                                                                         id=TriggerId.TASK_END_END.value,
                                                                         color='secondary',
                                                                         size='sm',
-                                                                        style={'width': '100%'},
+                                                                        style=TIME_BTN_STYLE,
                                                                     )
                                                                 ],
                                                                 width=2,
@@ -251,10 +281,7 @@ class AnnotationComponent(ControlComponent):
                                                             ),
                                                         ],
                                                         className='mb-2',
-                                                        style={
-                                                            'marginLeft': '0',
-                                                            'marginRight': '0',
-                                                        },
+                                                        style=TIME_ROW_STYLE,
                                                     ),
                                                 ]
                                             ),
@@ -307,451 +334,521 @@ class AnnotationComponent(ControlComponent):
         )
 
     def _toa_to_global_frame(self, toa_s: float) -> int:
-        """Convert timestamp to frame ID using reference camera."""
-        toa_diffs = np.abs(self._combined_toas - toa_s)
-        closest_idx = np.argmin(toa_diffs).item()
-        return closest_idx
+        """Convert timestamp to frame ID using reference camera (closest `toa_s`, the lowest frame ID on ties)."""
+        idx = np.searchsorted(self._sorted_toas, toa_s).item()
+        # The closest values are among the two sorted neighbors of the insertion point.
+        neighbors = self._sorted_toas[max(idx - 1, 0) : idx + 1]
+        neighbor_diffs = np.abs(neighbors - toa_s)
+        closest_toas = neighbors[neighbor_diffs == neighbor_diffs.min()]
+        # First of each run of equal values in the stable order is its lowest frame ID, like `argmin`.
+        return self._toa_order[np.searchsorted(self._sorted_toas, closest_toas)].min().item()
+
+    def _get_toa_str_global_frame(self, toa_str: str) -> int | None:
+        """Convert an annotation's timestamp string to frame ID.
+
+        Returns None for empty or non-numeric strings, as typed in by hand while editing.
+        """
+        if not toa_str:
+            return None
+        try:
+            toa_s = float(toa_str)
+        except ValueError:
+            return None
+        return self._toa_to_global_frame(toa_s)
+
+    def _duration_str(self, ann: Annotation) -> str:
+        """Format the duration between the start and end transitions of an annotation."""
+        try:
+            start_val = float(ann.task_start_end)
+            end_val = float(ann.task_end_start)
+            duration = end_val - start_val
+            return f'{duration:.2f}s'
+        except (TypeError, ValueError):
+            return 'N/A'
+
+    def _build_edit_card(self, idx: int, ann: Annotation) -> dbc.Card:
+        """Create the card of an annotation in edit mode (always expanded)."""
+        return dbc.Card(
+            [
+                dbc.CardBody(
+                    [
+                        # Counter and Update/Cancel buttons
+                        html.Div(
+                            [
+                                html.Span(f'#{idx + 1}', className='text-muted me-2'),
+                                html.Div(
+                                    [
+                                        dbc.Button(
+                                            'Cancel',
+                                            id={
+                                                'type': 'cancel-annotation',
+                                                'index': ann.id,
+                                            },
+                                            color='secondary',
+                                            size='sm',
+                                            className='me-2',
+                                        ),
+                                        dbc.Button(
+                                            'Update',
+                                            id={
+                                                'type': 'update-annotation',
+                                                'index': ann.id,
+                                            },
+                                            color='success',
+                                            size='sm',
+                                        ),
+                                    ],
+                                    className='d-flex',
+                                ),
+                            ],
+                            className='mb-2 d-flex justify-content-between align-items-center',
+                        ),
+                        # Compact edit form
+                        dcc.Dropdown(
+                            id={
+                                'type': 'annotation-label-edit',
+                                'index': ann.id,
+                            },
+                            options=self._annotation_options,
+                            value=ann.label,
+                            clearable=False,
+                            className='mb-2',
+                        ),
+                        # Task Start Transition row
+                        html.Small('Task Start Transition:', className='fw-bold'),
+                        dbc.Row(
+                            [
+                                dbc.Col(
+                                    [
+                                        dbc.Button(
+                                            'S',
+                                            id={
+                                                'type': TriggerId.CARD_START_START.value,
+                                                'index': ann.id,
+                                            },
+                                            color='secondary',
+                                            size='sm',
+                                            style=TIME_BTN_STYLE,
+                                        )
+                                    ],
+                                    width=2,
+                                ),
+                                dbc.Col(
+                                    [
+                                        dbc.Input(
+                                            id={
+                                                'type': InputId.CARD_START_START.value,
+                                                'index': ann.id,
+                                            },
+                                            value=ann.task_start_start,
+                                            type='text',
+                                            size='sm',
+                                        )
+                                    ],
+                                    width=4,
+                                ),
+                                dbc.Col(
+                                    [
+                                        dbc.Button(
+                                            'E',
+                                            id={
+                                                'type': TriggerId.CARD_START_END.value,
+                                                'index': ann.id,
+                                            },
+                                            color='secondary',
+                                            size='sm',
+                                            style=TIME_BTN_STYLE,
+                                        )
+                                    ],
+                                    width=2,
+                                ),
+                                dbc.Col(
+                                    [
+                                        dbc.Input(
+                                            id={
+                                                'type': InputId.CARD_START_END.value,
+                                                'index': ann.id,
+                                            },
+                                            value=ann.task_start_end,
+                                            type='text',
+                                            size='sm',
+                                        )
+                                    ],
+                                    width=4,
+                                ),
+                            ],
+                            className='mb-2',
+                            style=TIME_ROW_STYLE,
+                        ),
+                        # Task End Transition row
+                        html.Small('Task End Transition:', className='fw-bold'),
+                        dbc.Row(
+                            [
+                                dbc.Col(
+                                    [
+                                        dbc.Button(
+                                            'S',
+                                            id={
+                                                'type': TriggerId.CARD_END_START.value,
+                                                'index': ann.id,
+                                            },
+                                            color='secondary',
+                                            size='sm',
+                                            style=TIME_BTN_STYLE,
+                                        )
+                                    ],
+                                    width=2,
+                                ),
+                                dbc.Col(
+                                    [
+                                        dbc.Input(
+                                            id={
+                                                'type': InputId.CARD_END_START.value,
+                                                'index': ann.id,
+                                            },
+                                            value=ann.task_end_start,
+                                            type='text',
+                                            size='sm',
+                                        )
+                                    ],
+                                    width=4,
+                                ),
+                                dbc.Col(
+                                    [
+                                        dbc.Button(
+                                            'E',
+                                            id={
+                                                'type': TriggerId.CARD_END_END.value,
+                                                'index': ann.id,
+                                            },
+                                            color='secondary',
+                                            size='sm',
+                                            style=TIME_BTN_STYLE,
+                                        )
+                                    ],
+                                    width=2,
+                                ),
+                                dbc.Col(
+                                    [
+                                        dbc.Input(
+                                            id={
+                                                'type': InputId.CARD_END_END.value,
+                                                'index': ann.id,
+                                            },
+                                            value=ann.task_end_end,
+                                            type='text',
+                                            size='sm',
+                                        )
+                                    ],
+                                    width=4,
+                                ),
+                            ],
+                            style=TIME_ROW_STYLE,
+                        ),
+                    ],
+                    className='p-2',
+                )
+            ],
+            className='mb-2',
+            style=EDIT_CARD_STYLE,
+        )
 
-    def _create_annotation_cards(self, annotations: list[dict], expanded_state: dict[str, bool]) -> list[dbc.Card]:
-        """Helper function to create annotation cards."""
-        annotation_cards: list[dbc.Card] = []
+    def _build_display_card(self, idx: int, ann: Annotation, expanded: bool) -> dbc.Card:
+        """Create the card of an annotation: counter, label, start time, and duration, with all details and frame IDs.
 
-        for idx, ann in enumerate(annotations):
-            is_expanded = expanded_state.get(str(ann['id']), False)
+        Both the summary and the details are always rendered and only one of them is visible,
+        so expanding and collapsing is toggled in the browser without a server roundtrip.
+        """
+        duration_str = self._duration_str(ann)
 
-            if ann['edit_mode']:
-                # Edit mode - always expanded
-                card = dbc.Card(
+        # Get all frame IDs for expanded view.
+        ts_start_frame = self._toa_str_to_global_frame(ann.task_start_start)
+        ts_end_frame = self._toa_str_to_global_frame(ann.task_start_end)
+        te_start_frame = self._toa_str_to_global_frame(ann.task_end_start)
+        te_end_frame = self._toa_str_to_global_frame(ann.task_end_end)
+
+        return dbc.Card(
+            [
+                dbc.CardBody(
                     [
-                        dbc.CardBody(
+                        # Header with counter and controls
+                        html.Div(
                             [
-                                # Counter and Update/Cancel buttons
+                                # Left side: counter, expand button, label, start time
                                 html.Div(
                                     [
-                                        html.Span(f'#{idx + 1}', className='text-muted me-2'),
-                                        html.Div(
+                                        html.Span(
+                                            f'#{idx + 1}',
+                                            className='fw-bold text-muted me-2',
+                                        ),
+                                        dbc.Button(
+                                            '▼' if expanded else '▶',
+                                            id={
+                                                'type': 'expand-annotation',
+                                                'index': ann.id,
+                                            },
+                                            color='light',
+                                            size='sm',
+                                            className='me-2 border',
+                                            style=EXPAND_BTN_STYLE,
+                                        ),
+                                        html.Span(
+                                            f'{ann.label}',
+                                            className='fw-bold me-2',
+                                        ),
+                                        # Summary of the collapsed card
+                                        html.Span(
                                             [
-                                                dbc.Button(
-                                                    'Cancel',
-                                                    id={
-                                                        'type': 'cancel-annotation',
-                                                        'index': ann['id'],
-                                                    },
-                                                    color='secondary',
-                                                    size='sm',
-                                                    className='me-2',
+                                                html.Small(
+                                                    f'@ {ann.task_start_start[:10]}...',
+                                                    className='text-muted',
                                                 ),
-                                                dbc.Button(
-                                                    'Update',
-                                                    id={
-                                                        'type': 'update-annotation',
-                                                        'index': ann['id'],
-                                                    },
-                                                    color='success',
-                                                    size='sm',
+                                                html.Span(
+                                                    f' ({duration_str})',
+                                                    className='text-success ms-2',
                                                 ),
                                             ],
-                                            className='d-flex',
+                                            id={
+                                                'type': 'annotation-summary',
+                                                'index': ann.id,
+                                            },
+                                            style=HIDDEN_STYLE if expanded else VISIBLE_STYLE,
                                         ),
                                     ],
-                                    className='mb-2 d-flex justify-content-between align-items-center',
+                                    className='d-flex align-items-center',
                                 ),
-                                # Compact edit form
-                                dcc.Dropdown(
-                                    id={
-                                        'type': 'annotation-label-edit',
-                                        'index': ann['id'],
-                                    },
-                                    options=self._annotation_options,
-                                    value=ann['label'],
-                                    clearable=False,
-                                    className='mb-2',
-                                ),
-                                # Task Start Transition row
-                                html.Small('Task Start Transition:', className='fw-bold'),
-                                dbc.Row(
+                                # Right side: edit and delete buttons
+                                html.Div(
                                     [
-                                        dbc.Col(
-                                            [
-                                                dbc.Button(
-                                                    'S',
-                                                    id={
-                                                        'type': TriggerId.CARD_START_START.value,
-                                                        'index': ann['id'],
-                                                    },
-                                                    color='secondary',
-                                                    size='sm',
-                                                    style={'width': '100%'},
-                                                )
-                                            ],
-                                            width=2,
+                                        dbc.Button(
+                                            '✏',
+                                            id={
+                                                'type': 'edit-annotation',
+                                                'index': ann.id,
+                                            },
+                                            color='secondary',
+                                            size='sm',
+                                            style=EDIT_BTN_STYLE,
                                         ),
-                                        dbc.Col(
-                                            [
-                                                dbc.Input(
-                                                    id={
-                                                        'type': InputId.CARD_START_START.value,
-                                                        'index': ann['id'],
-                                                    },
-                                                    value=ann['task_start_start'],
-                                                    type='text',
-                                                    size='sm',
-                                                )
-                                            ],
-                                            width=4,
+                                        dbc.Button(
+                                            '🗑',
+                                            id={
+                                                'type': 'delete-annotation',
+                                                'index': ann.id,
+                                            },
+                                            color='danger',
+                                            size='sm',
+                                            style=DELETE_BTN_STYLE,
                                         ),
-                                        dbc.Col(
-                                            [
-                                                dbc.Button(
-                                                    'E',
-                                                    id={
-                                                        'type': TriggerId.CARD_START_END.value,
-                                                        'index': ann['id'],
-                                                    },
-                                                    color='secondary',
-                                                    size='sm',
-                                                    style={'width': '100%'},
-                                                )
-                                            ],
-                                            width=2,
+                                    ]
+                                ),
+                            ],
+                            className='d-flex justify-content-between align-items-center',
+                        ),
+                        # Compact details with frame IDs of the expanded card
+                        html.Div(
+                            [
+                                html.Div(
+                                    [
+                                        html.Small(
+                                            'Task Start Transition:',
+                                            className='fw-bold text-muted',
                                         ),
-                                        dbc.Col(
-                                            [
-                                                dbc.Input(
-                                                    id={
-                                                        'type': InputId.CARD_START_END.value,
-                                                        'index': ann['id'],
-                                                    },
-                                                    value=ann['task_start_end'],
-                                                    type='text',
-                                                    size='sm',
-                                                )
-                                            ],
-                                            width=4,
+                                        html.Small(
+                                            f' {ann.task_start_start} → {ann.task_start_end}',
+                                            className='text-muted',
+                                        ),
+                                        html.Small(
+                                            f' (frames {ts_start_frame} → {ts_end_frame})'
+                                            if ts_start_frame is not None and ts_end_frame is not None
+                                            else '',
+                                            className='text-info',
                                         ),
                                     ],
-                                    className='mb-2',
-                                    style={'marginLeft': '0', 'marginRight': '0'},
+                                    className='mb-1',
                                 ),
-                                # Task End Transition row
-                                html.Small('Task End Transition:', className='fw-bold'),
-                                dbc.Row(
+                                html.Div(
                                     [
-                                        dbc.Col(
-                                            [
-                                                dbc.Button(
-                                                    'S',
-                                                    id={
-                                                        'type': TriggerId.CARD_END_START.value,
-                                                        'index': ann['id'],
-                                                    },
-                                                    color='secondary',
-                                                    size='sm',
-                                                    style={'width': '100%'},
-                                                )
-                                            ],
-                                            width=2,
+                                        html.Small(
+                                            'Task End Transition:',
+                                            className='fw-bold text-muted',
                                         ),
-                                        dbc.Col(
-                                            [
-                                                dbc.Input(
-                                                    id={
-                                                        'type': InputId.CARD_END_START.value,
-                                                        'index': ann['id'],
-                                                    },
-                                                    value=ann['task_end_start'],
-                                                    type='text',
-                                                    size='sm',
-                                                )
-                                            ],
-                                            width=4,
+                                        html.Small(
+                                            f' {ann.task_end_start} → {ann.task_end_end}',
+                                            className='text-muted',
                                         ),
-                                        dbc.Col(
-                                            [
-                                                dbc.Button(
-                                                    'E',
-                                                    id={
-                                                        'type': TriggerId.CARD_END_END.value,
-                                                        'index': ann['id'],
-                                                    },
-                                                    color='secondary',
-                                                    size='sm',
-                                                    style={'width': '100%'},
-                                                )
-                                            ],
-                                            width=2,
-                                        ),
-                                        dbc.Col(
-                                            [
-                                                dbc.Input(
-                                                    id={
-                                                        'type': InputId.CARD_END_END.value,
-                                                        'index': ann['id'],
-                                                    },
-                                                    value=ann['task_end_end'],
-                                                    type='text',
-                                                    size='sm',
-                                                )
-                                            ],
-                                            width=4,
+                                        html.Small(
+                                            f' (frames {te_start_frame} → {te_end_frame})'
+                                            if te_start_frame is not None and te_end_frame is not None
+                                            else '',
+                                            className='text-info',
                                         ),
                                     ],
-                                    style={'marginLeft': '0', 'marginRight': '0'},
+                                    className='mb-1',
+                                ),
+                                html.Div(
+                                    [
+                                        html.Small(
+                                            'Duration:',
+                                            className='fw-bold text-muted',
+                                        ),
+                                        html.Small(
+                                            f' {duration_str}',
+                                            className='text-success fw-bold',
+                                        ),
+                                    ]
                                 ),
                             ],
-                            className='p-2',
-                        )
+                            id={
+                                'type': 'annotation-details',
+                                'index': ann.id,
+                            },
+                            className='mt-2',
+                            style=VISIBLE_STYLE if expanded else HIDDEN_STYLE,
+                        ),
                     ],
-                    className='mb-2',
-                    style={'backgroundColor': '#f8f9fa'},
+                    className='py-1 px-2',
                 )
-            else:
-                # Display mode - collapsible
-                try:
-                    # Duration calculation
-                    start_val = float(ann['task_start_end'])
-                    end_val = float(ann['task_end_start'])
-                    duration = end_val - start_val
-                    duration_str = f'{duration:.2f}s'
-                except:
-                    duration_str = 'N/A'
-
-                # Get frame IDs
-                ts_start_frame = self._toa_to_global_frame(float(ann['task_start_start']))
-
-                # Collapsed view - just show counter, label, start time, and duration
-                if not is_expanded:
-                    card = dbc.Card(
-                        [
-                            dbc.CardBody(
-                                [
-                                    html.Div(
-                                        [
-                                            # Left side: counter, expand button, label, start time
-                                            html.Div(
-                                                [
-                                                    html.Span(
-                                                        f'#{idx + 1}',
-                                                        className='fw-bold text-muted me-2',
-                                                    ),
-                                                    dbc.Button(
-                                                        '▼' if is_expanded else '▶',
-                                                        id={
-                                                            'type': 'expand-annotation',
-                                                            'index': ann['id'],
-                                                        },
-                                                        color='light',
-                                                        size='sm',
-                                                        className='me-2 border',
-                                                        style={
-                                                            'width': '25px',
-                                                            'height': '25px',
-                                                            'padding': '0',
-                                                            'lineHeight': '1',
-                                                            'fontSize': '12px',
-                                                        },
-                                                    ),
-                                                    html.Span(
-                                                        f'{ann["label"]}',
-                                                        className='fw-bold me-2',
-                                                    ),
-                                                    html.Small(
-                                                        f'@ {ann["task_start_start"][:10]}...',
-                                                        className='text-muted',
-                                                    ),
-                                                    html.Span(
-                                                        f' ({duration_str})',
-                                                        className='text-success ms-2',
-                                                    ),
-                                                ],
-                                                className='d-flex align-items-center',
-                                            ),
-                                            # Right side: edit and delete buttons
-                                            html.Div(
-                                                [
-                                                    dbc.Button(
-                                                        '✏',
-                                                        id={
-                                                            'type': 'edit-annotation',
-                                                            'index': ann['id'],
-                                                        },
-                                                        color='secondary',
-                                                        size='sm',
-                                                        style={
-                                                            'width': '25px',
-                                                            'height': '25px',
-                                                            'padding': '0',
-                                                            'marginRight': '5px',
-                                                        },
-                                                    ),
-                                                    dbc.Button(
-                                                        '🗑',
-                                                        id={
-                                                            'type': 'delete-annotation',
-                                                            'index': ann['id'],
-                                                        },
-                                                        color='danger',
-                                                        size='sm',
-                                                        style={
-                                                            'width': '25px',
-                                                            'height': '25px',
-                                                            'padding': '0',
-                                                        },
-                                                    ),
-                                                ]
-                                            ),
-                                        ],
-                                        className='d-flex justify-content-between align-items-center',
-                                    )
-                                ],
-                                className='py-1 px-2',
-                            )
-                        ],
-                        className='mb-1',
-                    )
-                else:
-                    # Get all frame IDs for expanded view.
-                    ts_start_frame = self._toa_to_global_frame(float(ann['task_start_start']))
-                    ts_end_frame = self._toa_to_global_frame(float(ann['task_start_end']))
-                    te_start_frame = self._toa_to_global_frame(float(ann['task_end_start']))
-                    te_end_frame = self._toa_to_global_frame(float(ann['task_end_end']))
-
-                    # Expanded view - show all details
-                    card = dbc.Card(
-                        [
-                            dbc.CardBody(
-                                [
-                                    # Header with counter and controls
-                                    html.Div(
-                                        [
-                                            html.Div(
-                                                [
-                                                    html.Span(
-                                                        f'#{idx + 1}',
-                                                        className='fw-bold text-muted me-2',
-                                                    ),
-                                                    dbc.Button(
-                                                        '▼',
-                                                        id={
-                                                            'type': 'expand-annotation',
-                                                            'index': ann['id'],
-                                                        },
-                                                        color='light',
-                                                        size='sm',
-                                                        className='me-2 border',
-                                                        style={
-                                                            'width': '25px',
-                                                            'height': '25px',
-                                                            'padding': '0',
-                                                            'lineHeight': '1',
-                                                            'fontSize': '12px',
-                                                        },
-                                                    ),
-                                                    html.Span(
-                                                        ann['label'],
-                                                        className='fw-bold',
-                                                    ),
-                                                ],
-                                                className='d-flex align-items-center',
-                                            ),
-                                            html.Div(
-                                                [
-                                                    dbc.Button(
-                                                        '✏',
-                                                        id={
-                                                            'type': 'edit-annotation',
-                                                            'index': ann['id'],
-                                                        },
-                                                        color='secondary',
-                                                        size='sm',
-                                                        style={
-                                                            'width': '25px',
-                                                            'height': '25px',
-                                                            'padding': '0',
-                                                            'marginRight': '5px',
-                                                        },
-                                                    ),
-                                                    dbc.Button(
-                                                        '🗑',
-                                                        id={
-                                                            'type': 'delete-annotation',
-                                                            'index': ann['id'],
-                                                        },
-                                                        color='danger',
-                                                        size='sm',
-                                                        style={
-                                                            'width': '25px',
-                                                            'height': '25px',
-                                                            'padding': '0',
-                                                        },
-                                                    ),
-                                                ]
-                                            ),
-                                        ],
-                                        className='d-flex justify-content-between align-items-center mb-2',
-                                    ),
-                                    # Compact details with frame IDs
-                                    html.Div(
-                                        [
-                                            html.Small(
-                                                'Task Start Transition:',
-                                                className='fw-bold text-muted',
-                                            ),
-                                            html.Small(
-                                                f' {ann["task_start_start"]} → {ann["task_start_end"]}',
-                                                className='text-muted',
-                                            ),
-                                            html.Small(
-                                                f' (frames {ts_start_frame} → {ts_end_frame})'
-                                                if ts_start_frame is not None and ts_end_frame is not None
-                                                else '',
-                                                className='text-info',
-                                            ),
-                                        ],
-                                        className='mb-1',
-                                    ),
-                                    html.Div(
-                                        [
-                                            html.Small(
-                                                'Task End Transition:',
-                                                className='fw-bold text-muted',
-                                            ),
-                                            html.Small(
-                                                f' {ann["task_end_start"]} → {ann["task_end_end"]}',
-                                                className='text-muted',
-                                            ),
-                                            html.Small(
-                                                f' (frames {te_start_frame} → {te_end_frame})'
-                                                if te_start_frame is not None and te_end_frame is not None
-                                                else '',
-                                                className='text-info',
-                                            ),
-                                        ],
-                                        className='mb-1',
-                                    ),
-                                    html.Div(
-                                        [
-                                            html.Small(
-                                                'Duration:',
-                                                className='fw-bold text-muted',
-                                            ),
-                                            html.Small(
-                                                f' {duration_str}',
-                                                className='text-success fw-bold',
-                                            ),
-                                        ]
-                                    ),
-                                ],
-                                className='p-2',
-                            )
-                        ],
-                        className='mb-2',
-                    )
+            ],
+            className='mb-1',
+        )
 
-            annotation_cards.append(card)
+    @staticmethod
+    def _cache_start_keys(annotations: list[Annotation]) -> None:
+        """Parse `task_start_start` of annotations that do not yet carry it as a float sort key."""
+        for ann in annotations:
+            if ann.ts_start_f is None:
+                ann.ts_start_f = Annotation.start_key(ann.task_start_start)
+
+    @staticmethod
+    def _renumber(annotations: list[Annotation], expanded_state: set[int]) -> set[int]:
+        """Renumber annotation IDs sequentially in list order and carry their expanded state over to the new IDs."""
+        # Nothing to remap if the order and IDs are already sequential (e.g. update that kept the start time)
+        if all(ann.id == idx for idx, ann in enumerate(annotations, start=1)):
+            return expanded_state
+
+        new_expanded_state: set[int] = set()
+        for idx, ann in enumerate(annotations, start=1):
+            if ann.id in expanded_state:
+                new_expanded_state.add(idx)
+            ann.id = idx
+        return new_expanded_state
+
+    @staticmethod
+    def _card_key(kind: str, idx: int, ann: Annotation) -> tuple:
+        """Fingerprint of everything a rendered annotation card depends on."""
+        return (
+            kind,
+            idx,
+            ann.id,
+            ann.label,
+            ann.task_start_start,
+            ann.task_start_end,
+            ann.task_end_start,
+            ann.task_end_end,
+        )
+
+    @staticmethod
+    def _cards_signature(annotations: list[Annotation], expanded_state: set[int]) -> tuple:
+        """Content signature of a rendered annotation list, used to detect renders that would not change anything."""
+        return (
+            tuple(
+                (
+                    ann.id,
+                    ann.edit_mode,
+                    ann.label,
+                    ann.task_start_start,
+                    ann.task_start_end,
+                    ann.task_end_start,
+                    ann.task_end_end,
+                )
+                for ann in annotations
+            ),
+            frozenset(expanded_state),
+        )
+
+    def _session_card_cache(self, session_id: str | None) -> AnnotationCardCache:
+        """Get the rendered card cache of a browser page, creating it if missing."""
+        with self._card_caches_lock:
+            cache = self._card_caches.get(session_id)
+            if cache is None:
+                cache = self._card_caches[session_id] = AnnotationCardCache()
+                if len(self._card_caches) > MAX_CARD_CACHE_SESSIONS:
+                    self._card_caches.popitem(last=False)
+            else:
+                self._card_caches.move_to_end(session_id)
+            return cache
+
+    def _create_annotation_cards(
+        self, annotations: list[Annotation], expanded_state: set[int], session_id: str | None
+    ) -> list[dbc.Card]:
+        """Helper function to create annotation cards.
+
+        Cards whose content did not change since the previous render of the same browser page are reused.
+        """
+        cache = self._session_card_cache(session_id)
+
+        # Return the previous render as is if neither the annotations nor their expanded state changed.
+        signature = self._cards_signature(annotations, expanded_state)
+        if cache.rendered is not None and cache.rendered[0] == signature:
+            return cache.rendered[1]
+
+        # Only keep the cards of the current render to bound the cache size.
+        old_cards = cache.cards
+        cache.cards = {}
+        annotation_cards = [
+            self._create_annotation_card(idx, ann, expanded_state, cache, old_cards)
+            for idx, ann in enumerate(annotations)
+        ]
+        cache.rendered = (signature, annotation_cards)
 
         return annotation_cards
 
+    def _create_annotation_card(
+        self,
+        idx: int,
+        ann: Annotation,
+        expanded_state: set[int],
+        cache: AnnotationCardCache,
+        old_cards: dict[tuple, dbc.Card] | None = None,
+    ) -> dbc.Card:
+        """Create the card of a single annotation, reusing the cached one if its content did not change."""
+        expanded = ann.id in expanded_state
+        kind = 'edit' if ann.edit_mode else 'expanded' if expanded else 'collapsed'
+        key = self._card_key(kind, idx, ann)
+
+        card = cache.cards.get(key)
+        if card is None and old_cards is not None:
+            card = old_cards.get(key)
+        if card is None:
+            if ann.edit_mode:
+                card = self._build_edit_card(idx, ann)
+            else:
+                card = self._build_display_card(idx, ann, expanded)
+        cache.cards[key] = card
+        return card
+
+    def _patch_annotation_card(
+        self, annotations: list[Annotation], ann: Annotation, expanded_state: set[int], session_id: str | None
+    ) -> Patch:
+        """Partial update of the rendered card list that only replaces the card of the given annotation."""
+        cache = self._session_card_cache(session_id)
+        idx = ann.id - 1  # IDs are sequential 1..N in list order
+        card = self._create_annotation_card(idx, ann, expanded_state, cache)
+
+        # Keep the list-level memo in sync with what the page shows after the patch.
+        # Cards are taken from the per-card cache, except for those expanded or collapsed in the browser since.
+        if cache.rendered is not None:
+            annotation_cards = [
+                card if i == idx else self._create_annotation_card(i, other, expanded_state, cache)
+                for i, other in enumerate(annotations)
+            ]
+            cache.rendered = (self._cards_signature(annotations, expanded_state), annotation_cards)
+
+        patch = Patch()
+        patch[idx] = card
+        return patch
+
     def activate_callbacks(self):
         @app.callback(
             Output('new-annotation-label', 'value', allow_duplicate=True),
@@ -782,8 +879,9 @@ class AnnotationComponent(ControlComponent):
         ):
             """Handle keyboard shortcuts for annotations."""
 
+            # Navigation keys share the store with the shortcuts, leave the panel untouched for them.
             if not keyboard_event:
-                return current_label, active_input, ts_start, ts_end, te_start, te_end
+                return (no_update,) * 6
 
             event_type: str = keyboard_event.get('type')
 
@@ -854,7 +952,7 @@ class AnnotationComponent(ControlComponent):
                     )
 
             # No relevant keyboard event
-            return current_label, active_input, ts_start, ts_end, te_start, te_end
+            return (no_update,) * 6
 
         @app.callback(
             Output(InputId.TASK_START_START.value, 'value'),
@@ -908,7 +1006,8 @@ class AnnotationComponent(ControlComponent):
             """Handle Start/End button clicks."""
 
             ctx = callback_context
-            if not ctx.triggered:
+            trigger_id = ctx.triggered_id
+            if trigger_id is None:
                 return (
                     ts_start_val,
                     ts_end_val,
@@ -920,8 +1019,6 @@ class AnnotationComponent(ControlComponent):
                     edit_te_end_vals,
                 )
 
-            trigger_id: str = ctx.triggered[0]['prop_id'].split('.')[0]
-
             # Check if this was actually triggered by a button click (n_clicks changed)
             trigger_value = ctx.triggered[0]['value']
             if trigger_value is None or trigger_value == 0:
@@ -998,11 +1095,10 @@ class AnnotationComponent(ControlComponent):
                     edit_te_end_vals,
                 )
 
-            # Handle edit annotation buttons
+            # Handle edit annotation buttons (pattern-matching IDs come already parsed)
             try:
-                parsed_id = json.loads(trigger_id.replace("'", '"'))
-                button_type = parsed_id['type']
-                button_index = parsed_id['index']
+                button_type = trigger_id['type']
+                button_index = trigger_id['index']
 
                 if button_type in [
                     TriggerId.CARD_START_START.value,
@@ -1088,7 +1184,6 @@ class AnnotationComponent(ControlComponent):
             Input({'type': 'update-annotation', 'index': ALL}, 'n_clicks'),
             Input({'type': 'cancel-annotation', 'index': ALL}, 'n_clicks'),
             Input({'type': 'delete-annotation', 'index': ALL}, 'n_clicks'),
-            Input({'type': 'expand-annotation', 'index': ALL}, 'n_clicks'),
             Input('confirm-delete', 'n_clicks'),
             Input('cancel-delete', 'n_clicks'),
             State(InputId.TASK_START_START.value, 'value'),
@@ -1105,6 +1200,7 @@ class AnnotationComponent(ControlComponent):
             State('delete-modal', 'is_open'),
             State('delete-target', 'data'),
             State('annotation-expanded', 'data'),
+            State('session-id', 'data'),
             prevent_initial_call=True,
         )
         def manage_annotations(
@@ -1113,7 +1209,6 @@ class AnnotationComponent(ControlComponent):
             update_clicks: int,
             cancel_clicks: int,
             delete_clicks: int,
-            expand_clicks: int,
             confirm_delete: int,
             cancel_delete: int,
             ts_start: str,
@@ -1121,7 +1216,7 @@ class AnnotationComponent(ControlComponent):
             te_start: str,
             te_end: str,
             label: str,
-            annotations: list[dict],
+            annotations_data: list[dict],
             edit_labels: list[str],
             edit_ts_starts: list[str],
             edit_ts_ends: list[str],
@@ -1129,25 +1224,25 @@ class AnnotationComponent(ControlComponent):
             edit_te_ends: list[str],
             modal_open: bool,
             delete_target: int,
-            expanded_state: dict[str, bool] | None,
+            expanded_ids: list[int] | None,
+            session_id: str | None,
         ):
             """Main annotation management callback."""
 
             ctx = callback_context
 
             # Get annotations from store_data
-            if not annotations:
-                annotations = []
+            annotations = [Annotation.from_dict(data) for data in annotations_data or ()]
 
-            # Initialize expanded state if needed
-            if expanded_state is None:
-                expanded_state = {}
+            # IDs of the expanded annotations, stored as a JSON list (a Store would turn integer dict keys into strings)
+            expanded_state = set(expanded_ids or ())
 
-            if not ctx.triggered:
-                annotation_cards = self._create_annotation_cards(annotations, expanded_state)
+            trigger_id = ctx.triggered_id
+            if trigger_id is None:
+                annotation_cards = self._create_annotation_cards(annotations, expanded_state, session_id)
                 counter_text = f'Total: {len(annotations)} annotations'
                 return (
-                    annotations,
+                    [ann.to_dict() for ann in annotations],
                     annotation_cards,
                     counter_text,
                     '',
@@ -1157,169 +1252,167 @@ class AnnotationComponent(ControlComponent):
                     self._annotation_values[0],
                     False,
                     None,
-                    expanded_state,
+                    sorted(expanded_state),
                 )
 
-            prop_id = ctx.triggered[0]['prop_id']
-
             # Handle adding new annotation
-            if prop_id == 'add-annotation-btn.n_clicks' and ts_start and ts_end and te_start and te_end:
-                # Find the maximum ID in existing annotations to ensure uniqueness
-                max_id = max([*map(lambda x: x['id'], annotations), 0])
-
-                new_annotation = {
-                    'id': max_id + 1,  # Always one more than the highest existing ID
-                    'label': label,
-                    'task_start_start': ts_start,
-                    'task_start_end': ts_end,
-                    'task_end_start': te_start,
-                    'task_end_end': te_end,
-                    'edit_mode': False,
-                }
-                annotations.append(new_annotation)
-
-                # Sort annotations by task_start_start timestamp
-                try:
-                    annotations.sort(key=lambda x: float(x['task_start_start']))
-                except:
-                    pass  # If conversion fails, keep original order
-
-                # After sorting, renumber all IDs sequentially
-                old_to_new_id_map: dict[str, str] = {}
-                for idx, ann in enumerate(annotations):
-                    old_id = ann['id']
-                    new_id = idx + 1
-                    old_to_new_id_map[str(old_id)] = str(new_id)
-                    ann['id'] = new_id
-
-                # Update expanded state with new IDs
-                new_expanded_state: dict[str, bool] = {}
-                for old_id_str, is_expanded in expanded_state.items():
-                    if old_id_str in old_to_new_id_map:
-                        new_expanded_state[old_to_new_id_map[old_id_str]] = is_expanded
-                expanded_state = new_expanded_state
+            if trigger_id == 'add-annotation-btn' and ts_start and ts_end and te_start and te_end:
+                # IDs are kept sequential 1..N by renumbering after every mutation (and on load),
+                # so the count is also the maximum ID in existing annotations
+                max_id = len(annotations)
+
+                new_annotation = Annotation(
+                    id=max_id + 1,  # Always one more than the highest existing ID
+                    label=label,
+                    task_start_start=ts_start,
+                    task_start_end=ts_end,
+                    task_end_start=te_start,
+                    task_end_end=te_end,
+                )
+
+                # Insert into the list, already sorted by task_start_start timestamp, at its sorted position
+                self._cache_start_keys(annotations)
+                self._cache_start_keys([new_annotation])
+                insert_idx = bisect_right(annotations, new_annotation.ts_start_f, key=attrgetter('ts_start_f'))
+                annotations.insert(insert_idx, new_annotation)
+
+                # Only annotations after the inserted one shift their ID up by one
+                for ann in annotations[insert_idx + 1 :]:
+                    ann.id += 1
+                new_annotation.id = insert_idx + 1
+                expanded_state = {i + 1 if i > insert_idx else i for i in expanded_state}
 
             # Handle delete confirmation
-            elif prop_id == 'confirm-delete.n_clicks' and delete_target is not None:
-                # When deleting, also remove the annotation
-                annotations = [ann for ann in annotations if ann['id'] != delete_target]
+            elif trigger_id == 'confirm-delete' and delete_target is not None:
+                # IDs are sequential 1..N, so the target sits at position `delete_target - 1`
+                del_idx = delete_target - 1
+                if 0 <= del_idx < len(annotations):
+                    # When deleting, also remove the annotation
+                    del annotations[del_idx]
+                    # After deletion, only the annotations that followed shift their ID down by one
+                    for ann in annotations[del_idx:]:
+                        ann.id -= 1
+                    # Remove from expanded state and shift the following ones along
+                    expanded_state = {i - 1 if i > delete_target else i for i in expanded_state if i != delete_target}
                 modal_open = False
-                # Remove from expanded state
-                if str(delete_target) in expanded_state:
-                    del expanded_state[str(delete_target)]
                 delete_target = None
 
-                # After deletion, renumber all IDs sequentially
-                old_to_new_id_map = {}
-                for idx, ann in enumerate(annotations):
-                    old_id = ann['id']
-                    new_id = idx + 1
-                    old_to_new_id_map[str(old_id)] = str(new_id)
-                    ann['id'] = new_id
-
-                # Update expanded state with new IDs
-                new_expanded_state = {}
-                for old_id_str, is_expanded in expanded_state.items():
-                    if old_id_str in old_to_new_id_map:
-                        new_expanded_state[old_to_new_id_map[old_id_str]] = is_expanded
-                expanded_state = new_expanded_state
-
             # Handle delete cancellation
-            elif prop_id == 'cancel-delete.n_clicks':
-                modal_open = False
-                delete_target = None
+            elif trigger_id == 'cancel-delete':
+                # Only the modal closes, leave the annotations and inputs untouched
+                return (
+                    no_update,
+                    no_update,
+                    no_update,
+                    no_update,
+                    no_update,
+                    no_update,
+                    no_update,
+                    no_update,
+                    False,
+                    None,
+                    no_update,
+                )
 
-            # Handle edit, update, cancel, delete, or expand button clicks
+            # Handle edit, update, cancel, or delete button clicks
             else:
-                if '.n_clicks' in prop_id:
-                    component_id = prop_id.replace('.n_clicks', '')
+                if isinstance(trigger_id, dict):
+                    # Index annotations by ID once instead of scanning the list per branch
+                    id_to_ann = {ann.id: ann for ann in annotations}
                     try:
-                        parsed_id = json.loads(component_id.replace("'", '"'))
-
-                        if parsed_id['type'] == 'expand-annotation':
-                            # Toggle expansion state
-                            ann_id_str = str(parsed_id['index'])
-                            expanded_state[ann_id_str] = not expanded_state.get(ann_id_str, False)
-
-                        elif parsed_id['type'] == 'edit-annotation':
-                            for ann in annotations:
-                                if ann['id'] == parsed_id['index']:
-                                    ann['edit_mode'] = True
-                                    # Ensure expanded when editing
-                                    expanded_state[str(ann['id'])] = True
-                                    break
-
-                        elif parsed_id['type'] == 'cancel-annotation':
-                            # Cancel edit mode without updating
-                            for ann in annotations:
-                                if ann['id'] == parsed_id['index']:
-                                    ann['edit_mode'] = False
-                                    break
-
-                        elif parsed_id['type'] == 'update-annotation':
-                            target_id = parsed_id['index']
-                            # Find the annotation to update
-                            for ann in annotations:
-                                if ann['id'] == target_id and ann['edit_mode']:
-                                    # Count annotations in edit mode that appear before this one
-                                    edit_position = 0
-                                    for other_ann in annotations:
-                                        if other_ann['edit_mode']:
-                                            if other_ann['id'] == target_id:
-                                                break
-                                            edit_position += 1
-
-                                    # Update using the correct position
-                                    if edit_position < len(edit_labels):
-                                        ann['label'] = edit_labels[edit_position]
-                                    if edit_position < len(edit_ts_starts):
-                                        ann['task_start_start'] = edit_ts_starts[edit_position]
-                                    if edit_position < len(edit_ts_ends):
-                                        ann['task_start_end'] = edit_ts_ends[edit_position]
-                                    if edit_position < len(edit_te_starts):
-                                        ann['task_end_start'] = edit_te_starts[edit_position]
-                                    if edit_position < len(edit_te_ends):
-                                        ann['task_end_end'] = edit_te_ends[edit_position]
-
-                                    ann['edit_mode'] = False
-                                    break
+                        if trigger_id['type'] in ('edit-annotation', 'cancel-annotation'):
+                            ann = id_to_ann.get(trigger_id['index'])
+                            if ann is None:
+                                raise KeyError(trigger_id['index'])
+
+                            if trigger_id['type'] == 'edit-annotation':
+                                ann.edit_mode = True
+                                # Ensure expanded when editing
+                                expanded_state.add(ann.id)
+                            else:
+                                # Cancel edit mode without updating
+                                ann.edit_mode = False
+
+                            # Only the card of this annotation changes, splice it into the rendered list
+                            return (
+                                [ann.to_dict() for ann in annotations],
+                                self._patch_annotation_card(annotations, ann, expanded_state, session_id),
+                                no_update,
+                                no_update,
+                                no_update,
+                                no_update,
+                                no_update,
+                                no_update,
+                                no_update,
+                                no_update,
+                                sorted(expanded_state),
+                            )
+
+                        elif trigger_id['type'] == 'update-annotation':
+                            target_id = trigger_id['index']
+                            # Find the annotation to update and its position among those in edit mode
+                            # (order of the edit inputs) in a single pass that stops at the target
+                            ann = None
+                            edit_position = 0
+                            for candidate in annotations:
+                                if candidate.edit_mode:
+                                    if candidate.id == target_id:
+                                        ann = candidate
+                                        break
+                                    edit_position += 1
+
+                            if ann is not None:
+                                # Update using the correct position
+                                if edit_position < len(edit_labels):
+                                    ann.label = edit_labels[edit_position]
+                                if edit_position < len(edit_ts_starts):
+                                    ann.task_start_start = edit_ts_starts[edit_position]
+                                if edit_position < len(edit_ts_ends):
+                                    ann.task_start_end = edit_ts_ends[edit_position]
+                                if edit_position < len(edit_te_starts):
+                                    ann.task_end_start = edit_te_starts[edit_position]
+                                if edit_position < len(edit_te_ends):
+                                    ann.task_end_end = edit_te_ends[edit_position]
+
+                                # Invalidate the cached sort key of the edited start time
+                                ann.ts_start_f = None
+                                ann.edit_mode = False
 
                             # Re-sort after update
-                            try:
-                                annotations.sort(key=lambda x: float(x['task_start_start']))
-                                # After sorting, renumber all IDs sequentially
-                                old_to_new_id_map = {}
-                                for idx, ann in enumerate(annotations):
-                                    old_id = ann['id']
-                                    new_id = idx + 1
-                                    old_to_new_id_map[str(old_id)] = str(new_id)
-                                    ann['id'] = new_id
-
-                                # Update expanded state with new IDs
-                                new_expanded_state = {}
-                                for old_id_str, is_expanded in expanded_state.items():
-                                    if old_id_str in old_to_new_id_map:
-                                        new_expanded_state[old_to_new_id_map[old_id_str]] = is_expanded
-                                expanded_state = new_expanded_state
-                            except:
-                                pass
-
-                        elif parsed_id['type'] == 'delete-annotation':
-                            modal_open = True
-                            delete_target = parsed_id['index']
-                    except:
+                            self._cache_start_keys(annotations)
+                            annotations.sort(key=attrgetter('ts_start_f'))
+                            # After sorting, renumber all IDs sequentially
+                            expanded_state = self._renumber(annotations, expanded_state)
+
+                        elif trigger_id['type'] == 'delete-annotation':
+                            # Only prompt for confirmation, nothing else changes until confirmed
+                            return (
+                                no_update,
+                                no_update,
+                                no_update,
+                                no_update,
+                                no_update,
+                                no_update,
+                                no_update,
+                                no_update,
+                                True,
+                                trigger_id['index'],
+                                no_update,
+                            )
+                    except KeyError:
+                        # Click on the card of an annotation that no longer exists, render the store as is
                         pass
 
             # Create annotation cards
-            annotation_cards = self._create_annotation_cards(annotations, expanded_state)
+            annotation_cards = self._create_annotation_cards(annotations, expanded_state, session_id)
 
             # Counter text
             counter_text = f'Total: {len(annotations)} annotations'
 
             # Clear inputs after adding
-            if prop_id == 'add-annotation-btn.n_clicks':
+            if trigger_id == 'add-annotation-btn':
                 return (
-                    annotations,
+                    [ann.to_dict() for ann in annotations],
                     annotation_cards,
                     counter_text,
                     '',
@@ -1329,11 +1422,11 @@ class AnnotationComponent(ControlComponent):
                     self._annotation_values[0],
                     modal_open,
                     delete_target,
-                    expanded_state,
+                    sorted(expanded_state),
                 )
             else:
                 return (
-                    annotations,
+                    [ann.to_dict() for ann in annotations],
                     annotation_cards,
                     counter_text,
                     ts_start,
@@ -1343,5 +1436,43 @@ class AnnotationComponent(ControlComponent):
                     label,
                     modal_open,
                     delete_target,
-                    expanded_state,
+                    sorted(expanded_state),
                 )
+
+        # Expanding and collapsing a card only flips the visibility of its parts, so it is done in the browser.
+        # The expanded IDs are still written to the store for the server to render cards in the same state.
+        app.clientside_callback(
+            """
+            function(n_clicks, button_id, expanded_ids) {
+                if (!n_clicks) {
+                    throw window.dash_clientside.PreventUpdate;
+                }
+                const ids = (expanded_ids || []).filter((id) => id !== button_id.index);
+                const expand = ids.length === (expanded_ids || []).length;
+                if (expand) {
+                    ids.push(button_id.index);
+                    ids.sort((a, b) => a - b);
+                }
+                window.dash_clientside.set_props('annotation-expanded', {data: ids});
+                return expand ? ['▼', {display: 'none'}, {}] : ['▶', {}, {display: 'none'}];
+            }
+            """,
+            Output({'type': 'expand-annotation', 'index': MATCH}, 'children'),
+            Output({'type': 'annotation-summary', 'index': MATCH}, 'style'),
+            Output({'type': 'annotation-details', 'index': MATCH}, 'style'),
+            Input({'type': 'expand-annotation', 'index': MATCH}, 'n_clicks'),
+            State({'type': 'expand-annotation', 'index': MATCH}, 'id'),
+            State('annotation-expanded', 'data'),
+            prevent_initial_call=True,
+        )
+
+        # Each page load gets its own random session ID, so the server keeps the rendered cards of every tab apart.
+        app.clientside_callback(
+            """
+            function(session_id) {
+                return session_id || Math.random().toString(36).slice(2) + Date.now().toString(36);
+            }
+            """,
+            Output('session-id', 'data'),
+            Input('session-id', 'data'),
+        )
@@ -25,7 +25,11 @@
 #
 # ############
 
-from dash import html, dcc, Input, Output, State, callback_context
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import json
+
+from dash import html, dcc, Input, Output, State, ctx
 import dash_bootstrap_components as dbc
 import numpy as np
 
@@ -34,6 +38,86 @@ from pysioviz.components.data import VideoComponent
 from pysioviz.utils.gui_utils import app
 from pysioviz.utils.types import GlobalVariableId, KeyType, TriggerId
 
+# Styles shared by reference between renders and callbacks (never mutate).
+TOGGLE_BTN_STYLE = {
+    'position': 'absolute',
+    'top': '-35px',
+    'right': '10px',
+    'width': '40px',
+    'height': '35px',
+    'fontSize': '16px',
+    'padding': '0',
+    'lineHeight': '35px',
+    'borderRadius': '4px 4px 0 0',
+    'border': '1px solid #0d6efd',
+    'borderBottom': 'none',
+    'backgroundColor': '#0d6efd',
+    'color': 'white',
+    'zIndex': '1001',
+    'boxShadow': '0 -2px 5px rgba(0,0,0,0.1)',
+}
+STEP_BTN_STYLE = {'width': '40px', 'font-weight': 'bold'}
+STEP_10_BTN_STYLE = {'width': '45px', 'font-weight': 'bold'}
+CONTENT_STYLE_VISIBLE = {
+    'display': 'block',
+    'backgroundColor': 'white',
+    'padding': '10px',
+    'boxShadow': '0 -2px 10px rgba(0,0,0,0.1)',
+    'borderTop': '1px solid #dee2e6',
+}
+CONTENT_STYLE_HIDDEN = {'display': 'none'}
+MAIN_STYLE_VISIBLE = {'marginBottom': '250px', 'transition': 'margin-bottom 0.3s ease-in-out'}
+MAIN_STYLE_HIDDEN = {'marginBottom': '10px', 'transition': 'margin-bottom 0.3s ease-in-out'}
+FINE_MARK_STYLE = {'fontSize': '12px'}
+FINE_CENTER_MARK_STYLE = {'fontSize': '12px', 'fontWeight': 'bold'}
+TIME_WINDOW_INFO_STYLE = {'fontSize': '11px', 'color': '#666'}
+# Single flex rows in place of a Row/Col grid per control
+FLEX_ROW_STYLE = {'display': 'flex', 'alignItems': 'center', 'gap': '8px'}
+FINE_ROW_STYLE = {**FLEX_ROW_STYLE, 'marginTop': '5px'}
+FLEX_FILL_STYLE = {'flex': '1', 'minWidth': '0'}
+FINE_WINDOW_SIZES = (100, 250, 500)
+DEFAULT_FINE_WINDOW_SIZE = 250
+FINE_DRAG_INTERVAL_MS = 166  # Fine slider drag updates at ~6 Hz
+PREFETCH_AHEAD_RATIO = 0.7  # Share of the prefetched frames in the direction of the last seek
+MAX_FRAMES_FOR_QUARTER_MARKS = 100_000  # Longer recordings only mark the ends of the main slider
+
+# Frame step of each navigation key by its 'key|shift|ctrl' combination (looked up in the browser).
+# Ctrl takes precedence over Shift on arrows, page keys ignore the modifiers.
+KEY_MODIFIERS = ((False, False), (True, False), (False, True), (True, True))
+KEY_FRAME_STEPS = {
+    **{
+        f'{key}|{shift:d}|{ctrl:d}': sign * (100 if ctrl else 10 if shift else 1)
+        for key, sign in ((KeyType.ARROW_LEFT.value, -1), (KeyType.ARROW_RIGHT.value, 1))
+        for shift, ctrl in KEY_MODIFIERS
+    },
+    **{
+        f'{key}|{shift:d}|{ctrl:d}': step
+        for key, step in ((KeyType.PAGE_UP.value, -1000), (KeyType.PAGE_DOWN.value, 1000))
+        for shift, ctrl in KEY_MODIFIERS
+    },
+}
+# Frame step of each step button by its ID.
+BUTTON_FRAME_STEPS = {
+    TriggerId.DECREMENT.value: -1,
+    TriggerId.INCREMENT.value: 1,
+    TriggerId.DECREMENT_10.value: -10,
+    TriggerId.INCREMENT_10.value: 10,
+}
+
+
+def _create_fine_marks(window_size: int) -> dict:
+    """Marks of the fine slider at 0%, 25%, 50%, 75%, and 100% of its window."""
+    return {
+        -window_size: {'label': f'-{window_size}', 'style': FINE_MARK_STYLE},
+        -window_size // 2: {'label': f'-{window_size // 2}', 'style': FINE_MARK_STYLE},
+        0: {'label': '0', 'style': FINE_CENTER_MARK_STYLE},
+        window_size // 2: {'label': f'{window_size // 2}', 'style': FINE_MARK_STYLE},
+        window_size: {'label': f'{window_size}', 'style': FINE_MARK_STYLE},
+    }
+
+
+FINE_MARKS = {window_size: _create_fine_marks(window_size) for window_size in FINE_WINDOW_SIZES}
+
 
 class FrameSliderComponent(ControlComponent):
     """Frame navigation and control component.
@@ -56,7 +140,24 @@ class FrameSliderComponent(ControlComponent):
         self._camera_components = camera_components
         self._combined_timestamps = combined_timestamps
         self._total_frames = len(combined_timestamps)
+        self._max_frame = self._total_frames - 1
         self._fps = camera_components[0]._fps
+        # Marks of the main slider at 0%, 25%, 50%, 75%, and 100% of the recording,
+        # only at the ends for long ones (the tooltip and the time display show the exact position).
+        n = self._total_frames
+        if n <= MAX_FRAMES_FOR_QUARTER_MARKS:
+            mark_frames = (0, n // 4, n // 2, 3 * n // 4, self._max_frame)
+        else:
+            mark_frames = (0, self._max_frame)
+        self._main_marks = {frame: f'{frame}' for frame in mark_frames}
+        # Camera timelines are fixed after loading, so revisited frames (scrubbing back and forth) reuse the sync timestamp
+        self._sync_timestamp_at_frame = lru_cache(maxsize=4096)(self._get_sync_timestamp_at_frame)
+        # Background warm-up of the sync timestamps around the current frame, the newest request supersedes older ones
+        self._prefetch_pool = ThreadPoolExecutor(max_workers=1)
+        self._prefetch_generation = 0
+        self._last_frame = 0
+        # Outputs of `update_frame_info` on page load, when the frame store is at its initial first frame
+        self._initial_frame_info = (self._sync_timestamp_at_frame(0), self._combined_timestamps.item(0))
         super().__init__(unique_id='frame_slider')
 
     @property
@@ -67,6 +168,41 @@ class FrameSliderComponent(ControlComponent):
     def combined_timestamps(self) -> np.ndarray:
         return self._combined_timestamps
 
+    def _get_sync_timestamp_at_frame(self, frame: int) -> float:
+        """Get sync timestamp of a reference frame from cameras (minimum `toa_s`)."""
+        ref_frame_timestamp = self._combined_timestamps.item(frame)
+        # Running reduction over the few cameras: lowest `toa_s` among those at the highest aligned `sequence`
+        # (to grab sync timestamp without bias to missing frames).
+        max_sequence = None
+        sync_timestamp = None
+        for cam in self._camera_components:
+            frame_id = cam.get_frame_for_timestamp(ref_frame_timestamp)
+            sequence = cam.get_sequence_at_frame(frame_id)
+            toa = cam.get_toa_at_frame(frame_id)
+            if max_sequence is None or sequence > max_sequence:
+                max_sequence, sync_timestamp = sequence, toa
+            elif sequence == max_sequence and toa < sync_timestamp:
+                sync_timestamp = toa
+        return sync_timestamp
+
+    def _prefetch_sync_timestamps(self, frame: int, window_size: int, direction: int, generation: int) -> None:
+        """Fill the sync timestamp cache for the fine slider window around a frame, mostly ahead in the seek direction."""
+        num_ahead = round(2 * window_size * PREFETCH_AHEAD_RATIO)
+        num_behind = 2 * window_size - num_ahead
+        ahead = self._frame_range(frame + direction, num_ahead, direction)
+        behind = self._frame_range(frame - direction, num_behind, -direction)
+        for frames in (ahead, behind):
+            for neighbor in frames:
+                # Stop as soon as the user moved on and a newer prefetch was requested
+                if generation != self._prefetch_generation:
+                    return
+                self._sync_timestamp_at_frame(neighbor)
+
+    def _frame_range(self, start: int, num: int, step: int) -> range:
+        """Up to `num` frames from `start` in the direction of `step`, clamped once to the recording."""
+        stop = start + step * num
+        return range(start, min(stop, self._total_frames) if step > 0 else max(stop, -1), step)
+
     def _create_layout(self):
         """Create frame control UI with collapsible design."""
         # Frame controls - fixed at bottom with integrated toggle button
@@ -80,23 +216,7 @@ class FrameSliderComponent(ControlComponent):
                             id='toggle-controls-btn',
                             color='primary',
                             size='sm',
-                            style={
-                                'position': 'absolute',
-                                'top': '-35px',
-                                'right': '10px',
-                                'width': '40px',
-                                'height': '35px',
-                                'fontSize': '16px',
-                                'padding': '0',
-                                'lineHeight': '35px',
-                                'borderRadius': '4px 4px 0 0',
-                                'border': '1px solid #0d6efd',
-                                'borderBottom': 'none',
-                                'backgroundColor': '#0d6efd',
-                                'color': 'white',
-                                'zIndex': '1001',
-                                'boxShadow': '0 -2px 5px rgba(0,0,0,0.1)',
-                            },
+                            style=TOGGLE_BTN_STYLE,
                         )
                     ]
                 ),
@@ -111,99 +231,56 @@ class FrameSliderComponent(ControlComponent):
                                         html.Div(
                                             [
                                                 html.Label('Drag slider to seek to frame (based on reference camera):'),
-                                                dbc.Row(
+                                                html.Div(
                                                     [
-                                                        dbc.Col(
-                                                            [
-                                                                dbc.Button(
-                                                                    '-10',
-                                                                    id='decrement-10-btn',
-                                                                    color='secondary',
-                                                                    size='sm',
-                                                                    style={
-                                                                        'width': '45px',
-                                                                        'font-weight': 'bold',
-                                                                    },
-                                                                )
-                                                            ],
-                                                            width='auto',
+                                                        dbc.Button(
+                                                            '-10',
+                                                            id='decrement-10-btn',
+                                                            color='secondary',
+                                                            size='sm',
+                                                            style=STEP_10_BTN_STYLE,
                                                         ),
-                                                        dbc.Col(
-                                                            [
-                                                                dbc.Button(
-                                                                    '-',
-                                                                    id='decrement-btn',
-                                                                    color='primary',
-                                                                    size='sm',
-                                                                    style={
-                                                                        'width': '40px',
-                                                                        'font-weight': 'bold',
-                                                                    },
-                                                                )
-                                                            ],
-                                                            width='auto',
+                                                        dbc.Button(
+                                                            '-',
+                                                            id='decrement-btn',
+                                                            color='primary',
+                                                            size='sm',
+                                                            style=STEP_BTN_STYLE,
                                                         ),
-                                                        dbc.Col(
-                                                            [
-                                                                dcc.Slider(
-                                                                    id='frame-slider',
-                                                                    min=0,
-                                                                    max=self._total_frames - 1,
-                                                                    value=0,
-                                                                    step=1,
-                                                                    marks={
-                                                                        0: '0',
-                                                                        self._total_frames
-                                                                        // 4: f'{self._total_frames // 4}',
-                                                                        self._total_frames
-                                                                        // 2: f'{self._total_frames // 2}',
-                                                                        3
-                                                                        * self._total_frames
-                                                                        // 4: f'{3 * self._total_frames // 4}',
-                                                                        self._total_frames
-                                                                        - 1: f'{self._total_frames - 1}',
-                                                                    },
-                                                                    tooltip={
-                                                                        'placement': 'bottom',
-                                                                        'always_visible': True,
-                                                                    },
-                                                                )
-                                                            ],
-                                                            width=True,
+                                                        html.Div(
+                                                            dcc.Slider(
+                                                                id='frame-slider',
+                                                                min=0,
+                                                                max=self._max_frame,
+                                                                value=0,
+                                                                step=1,
+                                                                marks=self._main_marks,
+                                                                tooltip={
+                                                                    'placement': 'bottom',
+                                                                    'always_visible': True,
+                                                                },
+                                                                # Seek on release: dragging only previews the frame in the time display,
+                                                                # the (heavier) frame change across all components happens once per drag.
+                                                                updatemode='mouseup',
+                                                            ),
+                                                            style=FLEX_FILL_STYLE,
                                                         ),
-                                                        dbc.Col(
-                                                            [
-                                                                dbc.Button(
-                                                                    '+',
-                                                                    id='increment-btn',
-                                                                    color='primary',
-                                                                    size='sm',
-                                                                    style={
-                                                                        'width': '40px',
-                                                                        'font-weight': 'bold',
-                                                                    },
-                                                                )
-                                                            ],
-                                                            width='auto',
+                                                        dbc.Button(
+                                                            '+',
+                                                            id='increment-btn',
+                                                            color='primary',
+                                                            size='sm',
+                                                            style=STEP_BTN_STYLE,
                                                         ),
-                                                        dbc.Col(
-                                                            [
-                                                                dbc.Button(
-                                                                    '+10',
-                                                                    id='increment-10-btn',
-                                                                    color='secondary',
-                                                                    size='sm',
-                                                                    style={
-                                                                        'width': '45px',
-                                                                        'font-weight': 'bold',
-                                                                    },
-                                                                )
-                                                            ],
-                                                            width='auto',
+                                                        dbc.Button(
+                                                            '+10',
+                                                            id='increment-10-btn',
+                                                            color='secondary',
+                                                            size='sm',
+                                                            style=STEP_10_BTN_STYLE,
                                                         ),
                                                     ],
-                                                    align='center',
-                                                    className='g-2',
+                                                    style=FLEX_ROW_STYLE,
                                                 ),
                                             ],
                                             className='mb-1',
@@ -211,90 +288,50 @@ class FrameSliderComponent(ControlComponent):
                                         # Fine control slider with window size dropdown
                                         html.Div(
                                             [
-                                                dbc.Row(
+                                                html.Div(
                                                     [
-                                                        dbc.Col(
-                                                            [
-                                                                dcc.Slider(
-                                                                    id='fine-frame-slider',
-                                                                    min=-250,
-                                                                    max=250,
-                                                                    value=0,
-                                                                    step=1,
-                                                                    marks={
-                                                                        -250: {
-                                                                            'label': '-250',
-                                                                            'style': {'fontSize': '12px'},
-                                                                        },
-                                                                        -125: {
-                                                                            'label': '-125',
-                                                                            'style': {'fontSize': '12px'},
-                                                                        },
-                                                                        0: {
-                                                                            'label': '0',
-                                                                            'style': {
-                                                                                'fontSize': '12px',
-                                                                                'fontWeight': 'bold',
-                                                                            },
-                                                                        },
-                                                                        125: {
-                                                                            'label': '125',
-                                                                            'style': {'fontSize': '12px'},
-                                                                        },
-                                                                        250: {
-                                                                            'label': '250',
-                                                                            'style': {'fontSize': '12px'},
-                                                                        },
-                                                                    },
-                                                                    tooltip={
-                                                                        'placement': 'top',
-                                                                        'always_visible': True,
-                                                                    },
-                                                                    included=False,
-                                                                    updatemode='drag',
-                                                                )
-                                                            ],
-                                                            width=True,
+                                                        html.Div(
+                                                            dcc.Slider(
+                                                                id='fine-frame-slider',
+                                                                min=-DEFAULT_FINE_WINDOW_SIZE,
+                                                                max=DEFAULT_FINE_WINDOW_SIZE,
+                                                                value=0,
+                                                                step=1,
+                                                                marks=FINE_MARKS[DEFAULT_FINE_WINDOW_SIZE],
+                                                                tooltip={
+                                                                    'placement': 'top',
+                                                                    'always_visible': True,
+                                                                },
+                                                                included=False,
+                                                            ),
+                                                            style=FLEX_FILL_STYLE,
                                                         ),
-                                                        dbc.Col(
-                                                            [
-                                                                dcc.Dropdown(
-                                                                    id='fine-slider-window-dropdown',
-                                                                    options=[
-                                                                        {
-                                                                            'label': '±100',
-                                                                            'value': 100,
-                                                                        },
-                                                                        {
-                                                                            'label': '±250',
-                                                                            'value': 250,
-                                                                        },
-                                                                        {
-                                                                            'label': '±500',
-                                                                            'value': 500,
-                                                                        },
-                                                                    ],
-                                                                    value=250,
-                                                                    clearable=False,
-                                                                    style={
-                                                                        'width': '100px',
-                                                                        'height': '36px',
-                                                                    },
-                                                                    searchable=False,
-                                                                )
+                                                        dcc.Dropdown(
+                                                            id='fine-slider-window-dropdown',
+                                                            options=[
+                                                                {'label': f'±{window_size}', 'value': window_size}
+                                                                for window_size in FINE_WINDOW_SIZES
                                                             ],
-                                                            width='auto',
+                                                            value=DEFAULT_FINE_WINDOW_SIZE,
+                                                            clearable=False,
+                                                            style={
+                                                                'width': '100px',
+                                                                'height': '36px',
+                                                            },
+                                                            searchable=False,
                                                         ),
                                                     ],
-                                                    align='center',
-                                                    className='g-2',
-                                                    style={'marginTop': '5px'},
+                                                    style=FINE_ROW_STYLE,
                                                 )
                                             ],
                                             id='fine-slider-container',
                                         ),
                                         # Time and frame display
                                         html.Div(
+                                            [
+                                                html.Div(id='time-display-frame'),
+                                                html.Div(id='time-display-window', style=TIME_WINDOW_INFO_STYLE),
+                                            ],
                                             id='time-display',
                                             className='text-center pt-2',
                                         ),
@@ -317,75 +354,42 @@ class FrameSliderComponent(ControlComponent):
         )
 
     def activate_callbacks(self):
-        @app.callback(
+        # Showing and hiding the controls only swaps styles, so it is done in the browser.
+        app.clientside_callback(
+            f"""
+            function(n_clicks, is_visible) {{
+                // Toggle visibility
+                const visible = n_clicks > 0 ? !is_visible : true;
+                if (visible) {{
+                    // Down arrow when expanded
+                    return [{json.dumps(CONTENT_STYLE_VISIBLE)}, {json.dumps(MAIN_STYLE_VISIBLE)}, true, '▼'];
+                }}
+                // Up arrow when collapsed
+                return [{json.dumps(CONTENT_STYLE_HIDDEN)}, {json.dumps(MAIN_STYLE_HIDDEN)}, false, '▲'];
+            }}
+            """,
             Output('frame-controls-content', 'style'),
             Output('imu-row', 'style', allow_duplicate=True),
             Output('controls-visible', 'data'),
             Output('toggle-controls-btn', 'children'),
-            Output('toggle-controls-btn', 'style'),
             Input('toggle-controls-btn', 'n_clicks'),
             State('controls-visible', 'data'),
             prevent_initial_call=True,
         )
-        def toggle_frame_controls(n_clicks, is_visible):
-            """Toggle controls visibility."""
-
-            if n_clicks is None:
-                n_clicks = 0
-
-            # Toggle visibility
-            new_visibility = not is_visible if n_clicks > 0 else True
-
-            # Base button style
-            base_button_style = {
-                'position': 'absolute',
-                'top': '-35px',
-                'right': '10px',
-                'width': '40px',
-                'height': '35px',
-                'fontSize': '16px',
-                'padding': '0',
-                'lineHeight': '35px',
-                'borderRadius': '4px 4px 0 0',
-                'border': '1px solid #0d6efd',
-                'borderBottom': 'none',
-                'backgroundColor': '#0d6efd',
-                'color': 'white',
-                'zIndex': '1001',
-                'boxShadow': '0 -2px 5px rgba(0,0,0,0.1)',
-            }
-
-            # Update styles based on visibility
-            if new_visibility:
-                content_style = {
-                    'display': 'block',
-                    'backgroundColor': 'white',
-                    'padding': '10px',
-                    'boxShadow': '0 -2px 10px rgba(0,0,0,0.1)',
-                    'borderTop': '1px solid #dee2e6',
-                }
-                imu_row_style = {
-                    'marginBottom': '250px',
-                    'transition': 'margin-bottom 0.3s ease-in-out',
-                }
-                button_text = '▼'  # Down arrow when expanded
-            else:
-                content_style = {'display': 'none'}
-                imu_row_style = {
-                    'marginBottom': '10px',
-                    'transition': 'margin-bottom 0.3s ease-in-out',
-                }
-                button_text = '▲'  # Up arrow when collapsed
-
-            return (
-                content_style,
-                imu_row_style,
-                new_visibility,
-                button_text,
-                base_button_style,
-            )
 
-        @app.callback(
+        # Resizing the fine slider window only swaps the prebuilt marks, so it is done in the browser.
+        app.clientside_callback(
+            f"""
+            function(window_size, current_fine_value) {{
+                const fineMarks = {json.dumps(FINE_MARKS)};
+                // Keep the current fine value if it's within the new range, otherwise reset to 0.
+                // An unchanged value is not rewritten, as that would re-enter the navigation callback.
+                const hasValue = current_fine_value !== null && current_fine_value !== undefined;
+                const inRange = hasValue && Math.abs(current_fine_value) <= window_size;
+                const newFineValue = inRange ? window.dash_clientside.no_update : 0;
+                return [window_size, -window_size, window_size, fineMarks[window_size], newFineValue];
+            }}
+            """,
             Output('fine-slider-window', 'data'),
             Output('fine-frame-slider', 'min'),
             Output('fine-frame-slider', 'max'),
@@ -395,201 +399,184 @@ class FrameSliderComponent(ControlComponent):
             State('fine-frame-slider', 'value'),
             prevent_initial_call=True,
         )
-        def update_fine_slider_window(window_size, current_fine_value):
-            """Update fine slider window size."""
-
-            # Only show marks at 0%, 25%, 50%, 75%, and 100%
-            marks = {
-                -window_size: {
-                    'label': f'-{window_size}',
-                    'style': {'fontSize': '12px'},
-                },
-                -window_size // 2: {
-                    'label': f'-{window_size // 2}',
-                    'style': {'fontSize': '12px'},
-                },
-                0: {'label': '0', 'style': {'fontSize': '12px', 'fontWeight': 'bold'}},
-                window_size // 2: {
-                    'label': f'{window_size // 2}',
-                    'style': {'fontSize': '12px'},
-                },
-                window_size: {'label': f'{window_size}', 'style': {'fontSize': '12px'}},
-            }
-
-            # Keep the current fine value if it's within the new range, otherwise reset to 0
-            new_fine_value = current_fine_value if current_fine_value and abs(current_fine_value) <= window_size else 0
-
-            return window_size, -window_size, window_size, marks, new_fine_value
 
-        @app.callback(
+        # Navigation is plain frame arithmetic, so it runs in the browser (outputs derived from the frame are in `update_frame_info`).
+        # The sliders are moved by the same callback that listens to them: Dash does not retrigger a callback
+        # from its own outputs, whereas syncing them from `frame-id` in a separate callback would
+        # echo every frame change back here as a slider input.
+        app.clientside_callback(
+            f"""
+            function(main_slider_value, fine_slider_value, fine_slider_drag_value, dec_clicks, inc_clicks, dec_10_clicks, inc_10_clicks, keyboard_event, current_frame, fine_center) {{
+                const noUpdate = window.dash_clientside.no_update;
+                const lastFrame = {self._max_frame};
+                const keyFrameSteps = {json.dumps(KEY_FRAME_STEPS)};
+                const buttonFrameSteps = {json.dumps(BUTTON_FRAME_STEPS)};
+                const clamp = (frame) => Math.max(0, Math.min(lastFrame, frame));
+                const isMissing = (value) => value === null || value === undefined;
+                // Initialize with safe defaults
+                current_frame = current_frame || 0;
+                fine_center = fine_center || 0;
+
+                // Dispatch on the component that triggered the callback
+                const trigger = window.dash_clientside.callback_context.triggered[0];
+                const triggerId = trigger.prop_id.slice(0, trigger.prop_id.lastIndexOf('.'));
+                const value = trigger.value;
+                let frame, fineValue, center;
+                if (triggerId in buttonFrameSteps) {{
+                    // Button clicks - update frame and recenter.
+                    frame = clamp(current_frame + buttonFrameSteps[triggerId]);
+                    fineValue = 0;
+                    center = frame;
+                }} else if (triggerId === '{TriggerId.KEYBOARD.value}') {{
+                    // Step by the frames of a navigation key and recenter the fine slider.
+                    if (!value || value.type !== 'navigation') {{
+                        return [noUpdate, noUpdate, noUpdate, noUpdate];
+                    }}
+                    const keyCombination = `${{value.key}}|${{Number(!!value.shift)}}|${{Number(!!value.ctrl)}}`;
+                    frame = clamp(current_frame + (keyFrameSteps[keyCombination] || 0));
+                    fineValue = 0;
+                    center = frame;
+                }} else if (triggerId === '{TriggerId.MAIN_SLIDER.value}') {{
+                    // Main slider moved - update frame and center fine slider.
+                    frame = isMissing(value) ? 0 : value;
+                    fineValue = 0;
+                    center = frame;
+                }} else if (triggerId === '{TriggerId.FINE_SLIDER_DRAG.value}') {{
+                    // Fine slider still being dragged - follow it, but leave the slider itself alone.
+                    frame = isMissing(value) ? current_frame : clamp(fine_center + value);
+                    fineValue = noUpdate;
+                    center = fine_center;
+                }} else if (triggerId === '{TriggerId.FINE_SLIDER.value}') {{
+                    // Fine slider moved - calculate frame based on stored center.
+                    frame = isMissing(value) ? current_frame : clamp(fine_center + value);
+                    fineValue = isMissing(value) ? 0 : value;
+                    center = isMissing(value) ? current_frame : fine_center;
+                }} else {{
+                    return [noUpdate, noUpdate, noUpdate, noUpdate];
+                }}
+
+                // Only write what changed (e.g. not when stepping against the boundaries),
+                // rewriting the same frame would still retrigger all the synchronized views.
+                return [
+                    frame !== current_frame ? frame : noUpdate,
+                    frame !== main_slider_value ? frame : noUpdate,
+                    fineValue !== fine_slider_value ? fineValue : noUpdate,
+                    center !== fine_center ? center : noUpdate,
+                ];
+            }}
+            """,
             Output(GlobalVariableId.FRAME_ID.value, 'data'),
             Output('frame-slider', 'value'),
             Output('fine-frame-slider', 'value'),
-            Output('time-display', 'children'),
-            Output(GlobalVariableId.SYNC_TIMESTAMP.value, 'data'),
-            Output(GlobalVariableId.REF_FRAME_TIMESTAMP.value, 'data'),
             Output('fine-slider-center', 'data'),
             Input('frame-slider', 'value'),
             Input('fine-frame-slider', 'value'),
+            Input('fine-slider-debounced', 'data'),
             Input('decrement-btn', 'n_clicks'),
             Input('increment-btn', 'n_clicks'),
             Input('decrement-10-btn', 'n_clicks'),
             Input('increment-10-btn', 'n_clicks'),
             Input('keyboard-event', 'data'),
             State(GlobalVariableId.FRAME_ID.value, 'data'),
-            State('fine-slider-window', 'data'),
             State('fine-slider-center', 'data'),
-            State(GlobalVariableId.SYNC_TIMESTAMP.value, 'data'),
-            prevent_initial_call=False,
+            prevent_initial_call=True,
         )
-        def update_frame_and_navigate(
-            main_slider_value: int,
-            fine_slider_value: int,
-            dec_clicks: int,
-            inc_clicks: int,
-            dec_10_clicks: int,
-            inc_10_clicks: int,
-            keyboard_event: dict,
-            current_frame: int,
-            window_size: int,
-            fine_center: int,
-            sync_timestamp: float,
-        ):
-            """Main navigation callback."""
-
-            ctx = callback_context
 
+        @app.callback(
+            Output(GlobalVariableId.SYNC_TIMESTAMP.value, 'data'),
+            Output(GlobalVariableId.REF_FRAME_TIMESTAMP.value, 'data'),
+            Input(GlobalVariableId.FRAME_ID.value, 'data'),
+            State('fine-slider-window', 'data'),
+            prevent_initial_call=False,
+        )
+        def update_frame_info(frame: int, window_size: int):
+            """Synchronize the timeline to the selected reference frame."""
+            if ctx.triggered_id is None:
+                return self._initial_frame_info
             # Initialize with safe defaults
-            if current_frame is None:
-                current_frame = 0
-            if fine_center is None:
-                fine_center = 0
-            if window_size is None:
-                window_size = 250
-
-            # Initialize values
-            update_center = False
-
-            # Determine which input triggered the callback
-            if not ctx.triggered:
-                frame = 0
-                fine_value = 0
-                new_center = 0
-            else:
-                trigger_id: str = ctx.triggered[0]['prop_id'].split('.')[0]
-
-                if trigger_id == TriggerId.KEYBOARD.value and keyboard_event:
-                    event_type = keyboard_event.get('type')
-
-                    if event_type == 'navigation':
-                        # Handle navigation keys
-                        key: str = keyboard_event.get('key')
-                        is_shift: bool = keyboard_event.get('shift', False)
-                        is_ctrl: bool = keyboard_event.get('ctrl', False)
-
-                        if key == KeyType.ARROW_LEFT.value:
-                            if is_ctrl:
-                                frame = max(0, current_frame - 100)
-                            elif is_shift:
-                                frame = max(0, current_frame - 10)
-                            else:
-                                frame = max(0, current_frame - 1)
-                        elif key == KeyType.ARROW_RIGHT.value:
-                            if is_ctrl:
-                                frame = min(self._total_frames - 1, current_frame + 100)
-                            elif is_shift:
-                                frame = min(self._total_frames - 1, current_frame + 10)
-                            else:
-                                frame = min(self._total_frames - 1, current_frame + 1)
-                        elif key == KeyType.PAGE_UP.value:
-                            frame = max(0, current_frame - 1000)
-                        elif key == KeyType.PAGE_DOWN.value:
-                            frame = min(self._total_frames - 1, current_frame + 1000)
-                        else:
-                            frame = current_frame
-
-                        fine_value = 0
-                        new_center = frame
-                        update_center = True
-                    else:
-                        # Not a navigation event, keep current state
-                        frame = current_frame
-                        fine_value = fine_slider_value if fine_slider_value is not None else 0
-                        new_center = fine_center
-
-                elif trigger_id == TriggerId.MAIN_SLIDER.value:
-                    # Main slider moved - update frame and center fine slider
-                    frame = main_slider_value if main_slider_value is not None else 0
-                    fine_value = 0  # Center the fine slider
-                    new_center = frame  # Update the center
-                    update_center = True
-
-                elif trigger_id == TriggerId.FINE_SLIDER.value:
-                    # Fine slider moved - calculate frame based on stored center
-                    if fine_slider_value is not None and fine_center is not None:
-                        # Calculate actual frame based on the stored center
-                        frame = fine_center + fine_slider_value
-                        frame = max(0, min(self._total_frames - 1, frame))
-                        fine_value = fine_slider_value
-                        new_center = fine_center  # Keep the same center
-                    else:
-                        frame = current_frame
-                        fine_value = 0
-                        new_center = current_frame
-
-                elif trigger_id in [
-                    TriggerId.DECREMENT.value,
-                    TriggerId.INCREMENT.value,
-                    TriggerId.DECREMENT_10.value,
-                    TriggerId.INCREMENT_10.value,
-                ]:
-                    # Button clicks - update frame and recenter
-                    if trigger_id == TriggerId.DECREMENT.value:
-                        frame = max(0, current_frame - 1)
-                    elif trigger_id == TriggerId.INCREMENT.value:
-                        frame = min(self._total_frames - 1, current_frame + 1)
-                    elif trigger_id == TriggerId.DECREMENT_10.value:
-                        frame = max(0, current_frame - 10)
-                    elif trigger_id == TriggerId.INCREMENT_10.value:
-                        frame = min(self._total_frames - 1, current_frame + 10)
-
-                    fine_value = 0
-                    new_center = frame
-                    update_center = True
-
-                else:
-                    frame = current_frame
-                    fine_value = 0
-                    new_center = fine_center if fine_center is not None else current_frame
+            frame = frame or 0
+            window_size = window_size or DEFAULT_FINE_WINDOW_SIZE
 
             # Get sync timestamp from cameras (minimum `toa_s`).
-            synced_frames: list[tuple[float, int]] = []
-            ref_frame_timestamp = self._combined_timestamps[frame]
-            for cam in self._camera_components:
-                frame_id = cam.get_frame_for_timestamp(ref_frame_timestamp)
-                # Compare for least `toa_s` only cameras that share the same max `sequence` (to grab sync timestamp without bias to missing frames).
-                synced_frames.append((cam.get_toa_at_frame(frame_id), cam.get_sequence_at_frame(frame_id)))
-            # Grab lowest `toa_s` for highest aligned `sequence`.
-            toa_arr, sequence_arr = (np.array(l) for l in zip(*synced_frames))
-            sync_timestamp: float = np.min(toa_arr[sequence_arr == np.max(sequence_arr)]).item()
-
-            # Calculate time display.
-            time_sec = frame / self._fps if self._fps > 0 else 0
-
-            # Add fine slider window range info.
-            window_start = max(0, new_center - window_size)
-            window_end = min(self._total_frames - 1, new_center + window_size)
-
-            time_display = html.Div(
-                [
-                    html.Div(
-                        f'Reference Frame: {frame} / {self._total_frames - 1} | Time: {int(time_sec // 60)}:{int(time_sec % 60):02d}.{int((time_sec % 1) * 1000):03d}'
-                    ),
-                    html.Div(
-                        f'Fine Control Window: [{window_start} - {window_end}] (Center: {new_center})',
-                        style={'fontSize': '11px', 'color': '#666'},
-                    ),
-                ]
+            ref_frame_timestamp = self._combined_timestamps.item(frame)
+            sync_timestamp: float = self._sync_timestamp_at_frame(frame)
+
+            # Warm up the cache for the next likely seeks (stepping, fine slider) while the user looks at this frame.
+            direction = -1 if frame < self._last_frame else 1
+            self._last_frame = frame
+            self._prefetch_generation += 1
+            self._prefetch_pool.submit(
+                self._prefetch_sync_timestamps, frame, window_size, direction, self._prefetch_generation
             )
 
-            return frame, frame, fine_value, time_display, sync_timestamp, ref_frame_timestamp, new_center
+            return sync_timestamp, ref_frame_timestamp
+
+        # The time display is only formatted from the frame, so it is rendered in the browser (as text into static divs).
+        app.clientside_callback(
+            f"""
+            function(frame, center, drag_frame, window_size) {{
+                const lastFrame = {self._max_frame};
+                const fps = {self._fps};
+                // Initialize with safe defaults
+                frame = frame || 0;
+                center = (center === null || center === undefined) ? frame : center;
+                window_size = window_size || {DEFAULT_FINE_WINDOW_SIZE};
+
+                // Preview the frame under the main slider while it is dragged, before it is committed on release.
+                const triggered = window.dash_clientside.callback_context.triggered.map((t) => t.prop_id);
+                if (triggered.includes('frame-slider.drag_value') && drag_frame !== null && drag_frame !== undefined) {{
+                    frame = drag_frame;
+                    center = drag_frame;
+                }}
+
+                // Calculate time display, split from whole milliseconds with exact integer arithmetic.
+                const totalMs = fps > 0 ? Math.floor((frame * 1000) / fps) : 0;
+                const minutes = Math.floor(totalMs / 60000);
+                const seconds = String(Math.floor(totalMs / 1000) % 60).padStart(2, '0');
+                const millis = String(totalMs % 1000).padStart(3, '0');
+
+                // Add fine slider window range info.
+                const windowStart = Math.max(0, center - window_size);
+                const windowEnd = Math.min(lastFrame, center + window_size);
+
+                return [
+                    `Reference Frame: ${{frame}} / ${{lastFrame}} | Time: ${{minutes}}:${{seconds}}.${{millis}}`,
+                    `Fine Control Window: [${{windowStart}} - ${{windowEnd}}] (Center: ${{center}})`,
+                ];
+            }}
+            """,
+            Output('time-display-frame', 'children'),
+            Output('time-display-window', 'children'),
+            Input(GlobalVariableId.FRAME_ID.value, 'data'),
+            Input('fine-slider-center', 'data'),
+            Input('frame-slider', 'drag_value'),
+            State('fine-slider-window', 'data'),
+            prevent_initial_call=False,
+        )
+
+        # Throttle fine slider drag events: the views follow the drag with the latest position at most every
+        # FINE_DRAG_INTERVAL_MS, and the release commits the final value through `value` (dropping a still pending update).
+        app.clientside_callback(
+            f"""
+            function(drag_value, value) {{
+                const state = window.dash_clientside.frameSlider = window.dash_clientside.frameSlider || {{}};
+                if (drag_value === undefined || drag_value === null || drag_value === value) {{
+                    clearTimeout(state.fineDragTimer);
+                    state.fineDragTimer = null;
+                    return window.dash_clientside.no_update;
+                }}
+                state.fineDragValue = drag_value;
+                if (!state.fineDragTimer) {{
+                    state.fineDragTimer = setTimeout(() => {{
+                        state.fineDragTimer = null;
+                        window.dash_clientside.set_props('fine-slider-debounced', {{data: state.fineDragValue}});
+                    }}, {FINE_DRAG_INTERVAL_MS});
+                }}
+                return window.dash_clientside.no_update;
+            }}
+            """,
+            Output('fine-slider-debounced', 'data'),
+            Input('fine-frame-slider', 'drag_value'),
+            Input('fine-frame-slider', 'value'),
+            prevent_initial_call=True,
+        )
@@ -25,15 +25,22 @@
 #
 # ############
 
-import json
-
-from dash import html, Input, Output, State, callback_context, ALL
+from dash import html, Input, Output, State, callback_context, no_update, ALL
 import dash_bootstrap_components as dbc
 
 from pysioviz.components.control import ControlComponent
 from pysioviz.components.data import DataComponent
 from pysioviz.utils.gui_utils import app
 
+# Offset change of each button type (reset sets the offset back to 0)
+OFFSET_BUTTON_STEPS = {
+    'offset-dec-10': -10,
+    'offset-dec': -1,
+    'offset-inc': 1,
+    'offset-inc-10': 10,
+    'offset-reset': None,
+}
+
 
 class OffsetComponent(ControlComponent):
     """Offset alignment control component.
@@ -54,6 +61,9 @@ class OffsetComponent(ControlComponent):
             all_components: All components (for applying offsets)
         """
         self._offset_components = offset_components
+        # Lookup of the components by their offset key, in the order of the offset value inputs in the layout
+        #   (which is also the order of their pattern-matching outputs)
+        self._offset_components_by_id = {comp._unique_id: comp for comp in offset_components if comp}
         super().__init__(unique_id='offset_panel')
 
     def _create_layout(self):
@@ -80,6 +90,9 @@ class OffsetComponent(ControlComponent):
                         dbc.Col(
                             [
                                 html.Div(
+                                    # The set of components is fixed, so the controls are built once and
+                                    #   the callback only updates their displayed values.
+                                    self._create_offset_controls(self._offset_components, {}),
                                     id='offsets-container',
                                     style={
                                         'maxHeight': '50vh',
@@ -235,19 +248,31 @@ class OffsetComponent(ControlComponent):
 
         return offset_controls
 
+    def _get_offset_values(self, offsets: dict[str, int]) -> list[str]:
+        """Displayed offset values of all controls, in layout order."""
+        return [str(offsets.get(offset_key, 0)) for offset_key in self._offset_components_by_id]
+
+    def _update_offset(self, offsets: dict[str, int], component_id: str, new_offset: int) -> None:
+        """Set the offset of one component in the offsets store and apply it to the component."""
+        if new_offset == 0:
+            # Remove zero offsets
+            offsets.pop(component_id, None)
+        else:
+            offsets[component_id] = new_offset
+        self._apply_offsets_to_components({component_id: new_offset})
+
     def _apply_offsets_to_components(self, offsets: dict[str, int]):
         """Apply offsets to components."""
         for comp_id, offset_value in offsets.items():
-            for comp in self._offset_components:
-                if comp._unique_id == comp_id:
-                    comp.set_offset(offset_value)
-                    break
+            comp = self._offset_components_by_id.get(comp_id)
+            if comp:
+                comp.set_offset(offset_value)
 
     def activate_callbacks(self):
         @app.callback(
             Output('offsets-store', 'data'),
             Output('offset-update-trigger', 'data'),
-            Output('offsets-container', 'children'),
+            Output({'type': 'offset-value', 'index': ALL}, 'value'),
             Input({'type': 'offset-value', 'index': ALL}, 'value'),
             Input({'type': 'offset-dec-10', 'index': ALL}, 'n_clicks'),
             Input({'type': 'offset-dec', 'index': ALL}, 'n_clicks'),
@@ -273,6 +298,10 @@ class OffsetComponent(ControlComponent):
             trigger_counter,
         ):
             ctx = callback_context
+            # Every `ctx` attribute goes through a context variable lookup, so the trigger is read once
+            triggered = ctx.triggered
+            trigger = triggered[0] if triggered else None
+            prop_id: str = trigger['prop_id'] if trigger else ''
 
             if not current_offsets:
                 current_offsets = {}
@@ -282,19 +311,15 @@ class OffsetComponent(ControlComponent):
                 trigger_counter = 0
 
             # Check if this was triggered by loading offsets
-            if ctx.triggered and ctx.triggered[0]['prop_id'] == 'offsets-store.data':
+            if prop_id == 'offsets-store.data':
                 # Offsets were loaded, apply them to components
                 self._apply_offsets_to_components(current_offsets)
 
                 # Update UI
-                offset_controls = self._create_offset_controls(self._offset_components, current_offsets)
-                return current_offsets, trigger_counter + 1, offset_controls
+                return current_offsets, trigger_counter + 1, self._get_offset_values(current_offsets)
 
             # Handle button clicks
-            elif ctx.triggered:
-                trigger = ctx.triggered[0]
-
-                prop_id: str = trigger['prop_id']
+            elif trigger:
                 if prop_id == 'reset-all-offsets-btn.n_clicks':
                     # Reset all offsets
                     current_offsets = {}
@@ -303,44 +328,32 @@ class OffsetComponent(ControlComponent):
                         comp.set_offset(0)
 
                 elif '.n_clicks' in prop_id or '.value' in prop_id:
-                    # Parse the trigger to find which button was clicked
-                    parsed_id = json.loads(prop_id.split('.')[0].replace("'", '"'))
-                    button_type = parsed_id['type']
-                    component_id = parsed_id['index']
+                    # Pattern-matching ID of the clicked button, already parsed by Dash
+                    trigger_id = ctx.triggered_id
+                    button_type = trigger_id['type']
+                    component_id = trigger_id['index']
 
                     # Get current offset
                     current_offset = current_offsets.get(component_id, 0)
 
                     if '.n_clicks' in prop_id:
                         # Update offset based on button type
-                        if button_type == 'offset-dec-10':
-                            new_offset = current_offset - 10
-                        elif button_type == 'offset-dec':
-                            new_offset = current_offset - 1
-                        elif button_type == 'offset-inc':
-                            new_offset = current_offset + 1
-                        elif button_type == 'offset-inc-10':
-                            new_offset = current_offset + 10
-                        elif button_type == 'offset-reset':
-                            new_offset = 0
-                        else:
-                            new_offset = current_offset
+                        step = OFFSET_BUTTON_STEPS.get(button_type, 0)
+                        new_offset = 0 if step is None else current_offset + step
 
                     else:
                         new_offset = int(trigger['value'])
 
-                    # Update offset in store
-                    if new_offset == 0:
-                        # Remove zero offsets
-                        current_offsets.pop(component_id, None)
-                    else:
-                        current_offsets[component_id] = new_offset
+                    # Clicks that leave the offset as is (e.g. resetting an unset offset) don't refresh the components
+                    if new_offset == current_offset:
+                        return no_update, no_update, no_update
 
-                    # Apply to specific component
-                    self._apply_offsets_to_components({component_id: new_offset})
+                    # Update offset in store and apply to specific component
+                    self._update_offset(current_offsets, component_id, new_offset)
 
-            # Create offset controls UI
-            offset_controls = self._create_offset_controls(self._offset_components, current_offsets)
+                    # Typed offsets are already shown by their input, leave it alone while the user is editing
+                    if '.value' in prop_id:
+                        return current_offsets, trigger_counter + 1, no_update
 
             # Increment trigger counter to force component updates
-            return current_offsets, trigger_counter + 1, offset_controls
+            return current_offsets, trigger_counter + 1, self._get_offset_values(current_offsets)
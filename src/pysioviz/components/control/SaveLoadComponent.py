@@ -25,6 +25,8 @@
 #
 # ############
 
+from operator import itemgetter
+
 import numpy as np
 import h5py
 import base64
@@ -115,8 +117,10 @@ class SaveLoadComponent(ControlComponent):
         """Save annotations and offsets to HDF5 file."""
         tmp_file_path = None
         try:
-            # Sort annotations before saving
-            sorted_annotations = sorted(annotations, key=lambda x: float(x['task_start_start']))
+            # Sort annotations before saving, decorated with their parsed start time
+            decorated = [(float(ann['task_start_start']), ann) for ann in annotations]
+            decorated.sort(key=itemgetter(0))
+            sorted_annotations = [ann for _, ann in decorated]
 
             # Create a structured numpy array for annotations WITHOUT ID
             ann_dtype = np.dtype(
@@ -134,16 +138,16 @@ class SaveLoadComponent(ControlComponent):
             ann_array = np.zeros(len(sorted_annotations), dtype=ann_dtype)
 
             # Fill the array (WITHOUT saving ID)
-            for idx, ann in enumerate(sorted_annotations):
+            for idx, (task_start_start, ann) in enumerate(decorated):
                 ann_array[idx]['label'] = ann['label'].encode('utf-8')
-                ann_array[idx]['task_start_start'] = float(ann['task_start_start'])
+                ann_array[idx]['task_start_start'] = task_start_start
                 ann_array[idx]['task_start_end'] = float(ann['task_start_end'])
                 ann_array[idx]['task_end_start'] = float(ann['task_end_start'])
                 ann_array[idx]['task_end_end'] = float(ann['task_end_end'])
 
                 # Calculate duration
                 try:
-                    duration = float(ann['task_end_end']) - float(ann['task_start_start'])
+                    duration = float(ann['task_end_end']) - task_start_start
                     ann_array[idx]['duration'] = duration
                 except:
                     ann_array[idx]['duration'] = -1
@@ -290,7 +294,9 @@ class SaveLoadComponent(ControlComponent):
 
                     # Sort annotations by task_start_start
                     try:
-                        annotations.sort(key=lambda x: float(x['task_start_start']))
+                        decorated = [(float(ann['task_start_start']), ann) for ann in annotations]
+                        decorated.sort(key=itemgetter(0))
+                        annotations = [ann for _, ann in decorated]
                         # Re-assign IDs after sorting to maintain sequential order
                         for idx, ann in enumerate(annotations):
                             ann['id'] = idx + 1
@@ -324,12 +330,12 @@ class SaveLoadComponent(ControlComponent):
                 message += f' from {filename}'
 
                 print(message)
-                return annotations, {}, offsets, {'message': message, 'type': 'success'}
+                return annotations, [], offsets, {'message': message, 'type': 'success'}
 
         except Exception as e:
             message = f'Error loading annotations: {str(e)}'
             print(message)
-            return [], {}, {}, {'message': message, 'type': 'danger'}
+            return [], [], {}, {'message': message, 'type': 'danger'}
         finally:
             # Clean up temporary file
             if tmp_file_path and os.path.exists(tmp_file_path):
@@ -341,16 +347,19 @@ class SaveLoadComponent(ControlComponent):
             Output('annotation-expanded', 'data', allow_duplicate=True),
             Output('offsets-store', 'data', allow_duplicate=True),
             Output('feedback-message', 'data'),
+            Output('annotations-load-trigger', 'data'),
             Input('upload-annotations', 'contents'),
             Input('upload-annotations', 'filename'),
+            State('annotations-load-trigger', 'data'),
             prevent_initial_call=True,
         )
-        def load_annotations(contents, filename):
+        def load_annotations(contents, filename, load_trigger):
             """Callback for Load Annotations from uploaded file."""
             if contents is None:
-                return [], {}, {}, None
+                return [], [], {}, None, load_trigger + 1
 
-            return self._load_from_hdf5(contents, filename)
+            # Signal the annotation display to re-render from the loaded store
+            return *self._load_from_hdf5(contents, filename), load_trigger + 1
 
         @app.callback(
             Output('download-annotations', 'data'),
@@ -37,6 +37,8 @@ class DataComponent(BaseComponent):
     def __init__(self, unique_id: str):
         self._toa_s: np.ndarray | None = None
         self.read_data()
+        # One contiguous float64 timeline for the binary searches of the frame lookups (no-op when already so)
+        self._toa_s = np.ascontiguousarray(self._toa_s, dtype=np.float64)
         self._align_info = AlignmentInfo(0, len(self._toa_s))
         self._offset_s = 0.0
         super().__init__(unique_id=unique_id)
@@ -69,9 +71,25 @@ class DataComponent(BaseComponent):
 
     def get_frame_for_toa(self, sync_timestamp: float) -> int:
         """Find the sample index closest but not later than a given timestamp, respecting alignment offset."""
-        time_diffs = (self._toa_s - (sync_timestamp + self._offset_s)) <= 0
-        return max(np.sum(time_diffs).item() - 1, 0)
+        # Binary search over the increasing `toa_s`, the offset is applied to the query instead of the array.
+        num_not_later = np.searchsorted(self._toa_s, sync_timestamp + self._offset_s, side='right').item()
+        return max(num_not_later - 1, 0)
+
+    def get_frames_for_toas(self, sync_timestamps: tuple[float, ...]) -> list[int]:
+        """Batched `get_frame_for_toa` for several timestamps, with a single binary search call."""
+        num_not_later = np.searchsorted(self._toa_s, np.add(sync_timestamps, self._offset_s), side='right')
+        return np.maximum(num_not_later - 1, 0).tolist()
     
+    @staticmethod
+    def _match_counters(ref_counters: np.ndarray, data_counters: np.ndarray) -> np.ndarray:
+        """Index of the first occurrence of each reference counter among the data counters, -1 where missing."""
+        unique_counters, first_indices = np.unique(data_counters, return_index=True)
+        if not len(unique_counters):
+            return np.full(len(ref_counters), -1)
+        # Binary search of each reference counter among the sorted distinct data counters
+        pos = np.minimum(np.searchsorted(unique_counters, ref_counters), len(unique_counters) - 1)
+        return np.where(unique_counters[pos] == ref_counters, first_indices[pos], -1)
+
     def set_offset(self, offset_ms: float) -> None:
         self._offset_s = offset_ms/1000
 
@@ -28,12 +28,13 @@
 import numpy as np
 import h5py
 
-from dash import Output, Input, State, dcc, html
+from dash import Output, Input, State, Patch, ctx, dcc, html
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
 from pysioviz.components.data import DataComponent
 from pysioviz.utils.gui_utils import app
+from pysioviz.utils.plot_utils import downsample_minmax
 from pysioviz.utils.types import GlobalVariableId
 
 
@@ -105,19 +106,20 @@ class ExoImuComponent(DataComponent):
         super().__init__(unique_id=unique_id)
 
     def read_data(self):
-        self._read_timestamps()
-        self._read_data()
-
-    def _read_timestamps(self):
+        # One file handle for all reads of the component
         with h5py.File(self._hdf5_path, 'r') as hdf5:
-            self._toa_s = hdf5[self._data_path]['toa_s'][:, 0]
-            self._first_timestamp = float(self._toa_s[0])
-            self._last_timestamp = float(self._toa_s[-1])
+            self._read_timestamps(hdf5)
+            self._read_data(hdf5)
 
-    def _read_data(self):
-        with h5py.File(self._hdf5_path, 'r') as hdf5:
-            for feature in self._features:
-                self._data[feature] = hdf5[self._data_path][feature][:]
+    def _read_timestamps(self, hdf5: h5py.File):
+        self._toa_s = hdf5[self._data_path]['toa_s'][:, 0]
+        self._first_timestamp = float(self._toa_s[0])
+        self._last_timestamp = float(self._toa_s[-1])
+
+    def _read_data(self, hdf5: h5py.File):
+        for feature in self._features:
+            # Single precision is plenty for plotting, converted while reading to halve memory and payloads
+            self._data[feature] = hdf5[self._data_path][feature].astype(np.float32)[:]
 
     def get_sync_info(self):
         return {
@@ -136,17 +138,33 @@ class ExoImuComponent(DataComponent):
         toa_s = self._toa_s[sample_id].item() if sample_id < len(self._toa_s) else 0
         return f'{self._legend_name} - toa_s: {toa_s:.5f} (index: {sample_id})'
 
-    def _create_figure(self, sync_timestamp: float, checklist: list[int]):
-        """Create the line plot figure for the given center index."""
-        center_idx = self.get_frame_for_toa(sync_timestamp)
-        start_idx = self.get_frame_for_toa(sync_timestamp - (self._plot_window_seconds / 2))
-        end_idx = self.get_frame_for_toa(sync_timestamp + (self._plot_window_seconds / 2))
+    def _get_window(
+        self, sync_timestamp: float, checklist: list[int]
+    ) -> tuple[list[tuple[np.ndarray, np.ndarray]], float, int]:
+        """Get the plotted (time, value) samples of each trace, the red line position, and the current sample index."""
+        half_window_s = self._plot_window_seconds / 2
+        start_idx, center_idx, end_idx = self.get_frames_for_toas(
+            (sync_timestamp - half_window_s, sync_timestamp, sync_timestamp + half_window_s)
+        )
 
         # Get data slice
         time_slice = self._toa_s[start_idx:end_idx+1] - self._toa_s[start_idx]
 
         # Calculate where the red line should be (current position in window)
-        red_line_position = self._toa_s[center_idx] - self._toa_s[start_idx]
+        red_line_position = self._toa_s.item(center_idx) - self._toa_s.item(start_idx)
+
+        # Samples of the checked axes of each feature, in the order of the figure traces.
+        #   Long windows are reduced to about as many samples as the plot has pixels.
+        traces_samples = []
+        for feature_name in self._features:
+            data_slice = self._data[feature_name][start_idx:end_idx+1]
+            for j in checklist:
+                traces_samples.append(downsample_minmax(time_slice, data_slice[:, j]))
+        return traces_samples, red_line_position, center_idx
+
+    def _create_figure(self, sync_timestamp: float, checklist: list[int]) -> tuple[go.Figure, int]:
+        """Create the line plot figure for the given center index."""
+        traces_samples, red_line_position, center_idx = self._get_window(sync_timestamp, checklist)
 
         # Create subplots for `euler` and `gyroscope`
         fig = make_subplots(
@@ -156,16 +174,17 @@ class ExoImuComponent(DataComponent):
             vertical_spacing=0.02,
         )
 
-        # Create plot
-        for i, feature_name in enumerate(self._features):
-            data_slice = self._data[feature_name][start_idx:end_idx+1]
+        # Create plot (the samples come per feature, per checked axis)
+        traces_samples = iter(traces_samples)
+        for i in range(len(self._features)):
             for j in checklist:
+                x, y = next(traces_samples)
                 fig.add_trace(
-                    go.Scatter(
-                        x=time_slice,
-                        y=data_slice[:, j],
+                    go.Scattergl(
+                        x=x,
+                        y=y,
                         mode='lines',
-                        name=f'{['Euler', 'Gyro'][i]} ({['X', 'Y', 'Z'][j]})',
+                        name=f"{['Euler', 'Gyro'][i]} ({['X', 'Y', 'Z'][j]})",
                         line=dict(width=1, color=['blue', 'green', 'red'][j]),
                     ),
                     row=i+1,
@@ -194,29 +213,51 @@ class ExoImuComponent(DataComponent):
         fig.update_xaxes(
             title_text='Time (s)',
             range=[0, self._plot_window_seconds],
-            row=3,
+            row=len(self._features),
             col=1,
         )
 
         return fig, center_idx
 
+    def _patch_figure(self, sync_timestamp: float, checklist: list[int]) -> tuple[Patch, int]:
+        """Update only the samples and the red line of the figure already shown for the checked axes."""
+        traces_samples, red_line_position, center_idx = self._get_window(sync_timestamp, checklist)
+
+        fig = Patch()
+        for i, (x, y) in enumerate(traces_samples):
+            fig['data'][i]['x'] = x
+            fig['data'][i]['y'] = y
+        # `add_vline` drew the red line on each subplot holding traces, so on none without checked axes
+        for i in range(len(self._features) if checklist else 0):
+            fig['layout']['shapes'][i]['x0'] = red_line_position
+            fig['layout']['shapes'][i]['x1'] = red_line_position
+
+        return fig, center_idx
+
     def activate_callbacks(self):
+        checklist_id = f'{self._unique_id}-exo_imu-checklist'
+
         @app.callback(
             Output(f'{self._unique_id}-exo_imu-plot', 'figure'),
             Output(f'{self._unique_id}-timestamp', 'children'),
             Input(GlobalVariableId.SYNC_TIMESTAMP.value, 'data'),
-            Input(f'{self._unique_id}-exo_imu-checklist', 'value'),
+            Input(checklist_id, 'value'),
             Input('offset-update-trigger', 'data'),
-            State(f'{self._unique_id}-exo_imu-checklist', 'value'),
+            State(checklist_id, 'value'),
             prevent_initial_call=False,
         )
         def update_plot(sync_timestamp, _, offset_trigger, checklist):
             try:
-                if sync_timestamp is not None:
+                if sync_timestamp is None:
+                    # Show initial data at start_idx if no sync
+                    sync_timestamp = self._first_timestamp
+
+                # The figure is built in full on page load and change of the checked axes,
+                # slider and offset updates keep its layout and only move the samples
+                if ctx.triggered_id is None or checklist_id in ctx.triggered_prop_ids.values():
                     fig, center_idx = self._create_figure(sync_timestamp, checklist)
                 else:
-                    # Show initial data at start_idx if no sync
-                    fig, center_idx = self._create_figure(self._first_timestamp, checklist)
+                    fig, center_idx = self._patch_figure(sync_timestamp, checklist)
 
                 # Get timestamp for display
                 toa_s = self._toa_s[center_idx]
@@ -28,12 +28,13 @@
 import numpy as np
 import h5py
 
-from dash import Output, Input, dcc, html
+from dash import Output, Input, Patch, ctx, dcc, html
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
 from pysioviz.components.data import DataComponent
 from pysioviz.utils.gui_utils import app
+from pysioviz.utils.plot_utils import downsample_minmax
 from pysioviz.utils.types import GlobalVariableId
 
 
@@ -128,57 +129,55 @@ class ImuComponent(DataComponent):
         super().__init__(unique_id=unique_id)
 
     def read_data(self):
-        self._read_timestamps()
-        self._read_data()
-        self._match_data_to_time()
-        self._adjust_plot_ranges()
-
-    def _read_timestamps(self):
+        # One file handle for all reads of the component
         with h5py.File(self._hdf5_path, 'r') as hdf5:
-            if self._timestamp_path in hdf5:
-                self._toa_s = hdf5[self._timestamp_path][:, 0]
-                self._first_timestamp = float(self._toa_s[0])
-                self._last_timestamp = float(self._toa_s[-1])
-            else:
-                raise ValueError(f'Timestamp path {self._timestamp_path} not found in HDF5')
-
-    def _read_data(self):
-        with h5py.File(self._hdf5_path, 'r') as hdf5:
-            if self._data_path in hdf5:
-                self._data = hdf5[self._data_path][:]
-                # Expected shape: (num_timestamps, 17 joints, 3 axes) - TODO: NUM_JOINTS FLEXIBLE FOR REVALEXO
-                if len(self._data.shape) != 3 or self._data.shape[1] != 17 or self._data.shape[2] != 3:
-                    raise ValueError(f'Expected IMU data shape (timestamps, 17, 3), got {self._data.shape}')
-            else:
-                raise ValueError(f'Data path {self._data_path} not found in HDF5')
-
-    def _match_data_to_time(self):
-        """Match data and timestamp by `counter` sequence id."""
-        with h5py.File(self._hdf5_path, 'r') as hdf5:
-            ref_counters = hdf5[self._ref_counter_path][:, 0]
-            data_counters = hdf5[self._data_counter_path][:, 0]
-
-            # Create a mapping from values to their first occurrence index in data counters
-            _, first_indices = np.unique(data_counters, return_index=True)
-            value_to_first_idx = dict(zip(data_counters[first_indices], first_indices))
+            self._read_timestamps(hdf5)
+            self._read_data(hdf5)
+            self._match_data_to_time(hdf5)
+        # Store as (joints, axes, timestamps), so the window of one joint and axis is a contiguous slice
+        self._data = np.ascontiguousarray(self._data.transpose(1, 2, 0))
+        self._adjust_plot_ranges()
 
-            # Look up each element of reference counters
-            matches = np.array([value_to_first_idx.get(val, -1) for val in ref_counters])
-            self._toa_s = self._toa_s[matches >= 0]
+    def _read_timestamps(self, hdf5: h5py.File):
+        if self._timestamp_path in hdf5:
+            self._toa_s = hdf5[self._timestamp_path][:, 0]
             self._first_timestamp = float(self._toa_s[0])
             self._last_timestamp = float(self._toa_s[-1])
-            self._data = self._data[matches[matches >= 0]]
-            print(
-                f'{self._sensor_type} data length ({len(self._data)}) ?= timestamp length ({len(self._toa_s)})',
-                flush=True,
-            )
+        else:
+            raise ValueError(f'Timestamp path {self._timestamp_path} not found in HDF5')
+
+    def _read_data(self, hdf5: h5py.File):
+        if self._data_path in hdf5:
+            # Single precision is plenty for plotting, converted while reading to halve memory and payloads
+            self._data = hdf5[self._data_path].astype(np.float32)[:]
+            # Expected shape: (num_timestamps, 17 joints, 3 axes) - TODO: NUM_JOINTS FLEXIBLE FOR REVALEXO
+            if len(self._data.shape) != 3 or self._data.shape[1] != 17 or self._data.shape[2] != 3:
+                raise ValueError(f'Expected IMU data shape (timestamps, 17, 3), got {self._data.shape}')
+        else:
+            raise ValueError(f'Data path {self._data_path} not found in HDF5')
+
+    def _match_data_to_time(self, hdf5: h5py.File):
+        """Match data and timestamp by `counter` sequence id."""
+        ref_counters = hdf5[self._ref_counter_path][:, 0]
+        data_counters = hdf5[self._data_counter_path][:, 0]
+
+        # Look up the first occurrence of each element of reference counters
+        matches = self._match_counters(ref_counters, data_counters)
+        self._toa_s = self._toa_s[matches >= 0]
+        self._first_timestamp = float(self._toa_s[0])
+        self._last_timestamp = float(self._toa_s[-1])
+        self._data = self._data[matches[matches >= 0]]
+        print(
+            f'{self._sensor_type} data length ({len(self._data)}) ?= timestamp length ({len(self._toa_s)})',
+            flush=True,
+        )
 
     def _adjust_plot_ranges(self):
         # Calculate symmetric y-axis scaling using percentiles
         # Use percentiles to handle outliers, then create symmetric scale
         # This could truncate extreme values, but double clicking on the graph will bring them back to view
-        percentile_low = np.percentile(self._data, 1)
-        percentile_high = np.percentile(self._data, 99)
+        # (both percentiles from a single partition of the data)
+        percentile_low, percentile_high = np.percentile(self._data, [1, 99]).tolist()
 
         # Find the maximum absolute value with 2x factor for more headroom
         max_abs_value = max(abs(2 * percentile_low), abs(2 * percentile_high))
@@ -212,17 +211,28 @@ class ImuComponent(DataComponent):
         toa_s = self._toa_s[sample_id].item() if sample_id < len(self._toa_s) else 0
         return f'IMU {self._sensor_type} - toa_s: {toa_s:.5f} (index: {sample_id})'
 
-    def _create_figure(self, sync_timestamp: float, joint_idx: int) -> go.Figure:
-        center_idx = self.get_frame_for_toa(sync_timestamp)
-        start_idx = self.get_frame_for_toa(sync_timestamp - (self._plot_window_seconds / 2))
-        end_idx = self.get_frame_for_toa(sync_timestamp + (self._plot_window_seconds / 2))
+    def _get_window(
+        self, sync_timestamp: float, joint_idx: int
+    ) -> tuple[list[tuple[np.ndarray, np.ndarray]], float, int]:
+        """Get the plotted (time, value) samples of each axis, the red line position, and the current sample index."""
+        half_window_s = self._plot_window_seconds / 2
+        start_idx, center_idx, end_idx = self.get_frames_for_toas(
+            (sync_timestamp - half_window_s, sync_timestamp, sync_timestamp + half_window_s)
+        )
 
-        # Get data slice
-        data_slice = self._data[start_idx:end_idx+1, joint_idx, :]
+        # Get data slice (axes, samples)
+        data_slice = self._data[joint_idx, :, start_idx:end_idx+1]
         time_slice = self._toa_s[start_idx:end_idx+1] - self._toa_s[start_idx]
 
         # Calculate where the red line should be (current position in window)
-        red_line_position = self._toa_s[center_idx] - self._toa_s[start_idx]
+        red_line_position = self._toa_s.item(center_idx) - self._toa_s.item(start_idx)
+
+        # Long windows are reduced to about as many samples as the plot has pixels
+        axes_samples = [downsample_minmax(time_slice, data_slice[i]) for i in range(3)]
+        return axes_samples, red_line_position, center_idx
+
+    def _create_figure(self, sync_timestamp: float, joint_idx: int) -> tuple[go.Figure, int]:
+        axes_samples, red_line_position, center_idx = self._get_window(sync_timestamp, joint_idx)
 
         # Create subplots for X, Y, Z
         fig = make_subplots(
@@ -236,11 +246,11 @@ class ImuComponent(DataComponent):
         colors = ['blue', 'green', 'red']
         axes = ['X', 'Y', 'Z']
 
-        for i in range(3):
+        for i, (x, y) in enumerate(axes_samples):
             fig.add_trace(
-                go.Scatter(
-                    x=time_slice,
-                    y=data_slice[:, i],
+                go.Scattergl(
+                    x=x,
+                    y=y,
                     mode='lines',
                     name=axes[i],
                     line=dict(width=1, color=colors[i]),
@@ -255,12 +265,12 @@ class ImuComponent(DataComponent):
             #     col=1,
             # )
 
-            # Add vertical line at current position
-            fig.add_vline(
-                x=red_line_position,
-                line_dash='dash',
-                line_color='red',
-            )
+        # Add vertical line at current position (once, it spans all subplots)
+        fig.add_vline(
+            x=red_line_position,
+            line_dash='dash',
+            line_color='red',
+        )
 
         # Update layout
         fig.update_layout(
@@ -278,12 +288,29 @@ class ImuComponent(DataComponent):
 
         return fig, center_idx
 
+    def _patch_figure(self, sync_timestamp: float, joint_idx: int) -> tuple[Patch, int]:
+        """Update only the samples and the red line of the figure already shown for the joint."""
+        axes_samples, red_line_position, center_idx = self._get_window(sync_timestamp, joint_idx)
+
+        fig = Patch()
+        for i, (x, y) in enumerate(axes_samples):
+            fig['data'][i]['x'] = x
+            fig['data'][i]['y'] = y
+        # `add_vline` drew the red line on each subplot, one per axis
+        for i in range(len(axes_samples)):
+            fig['layout']['shapes'][i]['x0'] = red_line_position
+            fig['layout']['shapes'][i]['x1'] = red_line_position
+
+        return fig, center_idx
+
     def activate_callbacks(self):
+        joint_dropdown_id = f'{self._unique_id}-joint-dropdown'
+
         @app.callback(
             Output(f'{self._unique_id}-imu-plot', 'figure'),
             Output(f'{self._unique_id}-timestamp', 'children'),
             Input(GlobalVariableId.SYNC_TIMESTAMP.value, 'data'),
-            Input(f'{self._unique_id}-joint-dropdown', 'value'),
+            Input(joint_dropdown_id, 'value'),
             Input('offset-update-trigger', 'data'),
             prevent_initial_call=False,
         )
@@ -292,11 +319,16 @@ class ImuComponent(DataComponent):
                 # Update selected joint
                 joint_idx = selected_joint if selected_joint is not None else 0
 
-                if sync_timestamp is not None:
+                if sync_timestamp is None:
+                    # Show initial data at start_idx if no sync
+                    sync_timestamp = self._first_timestamp
+
+                # The figure is built in full on page load and joint change,
+                # slider and offset updates keep its layout and only move the samples
+                if ctx.triggered_id is None or joint_dropdown_id in ctx.triggered_prop_ids.values():
                     fig, center_idx = self._create_figure(sync_timestamp, joint_idx)
                 else:
-                    # Show initial data at start_idx if no sync
-                    fig, center_idx = self._create_figure(self._first_timestamp, joint_idx)
+                    fig, center_idx = self._patch_figure(sync_timestamp, joint_idx)
 
                 # Get timestamp for display
                 toa_s = self._toa_s[center_idx]
@@ -128,9 +128,10 @@ class MotorComponent(DataComponent):
 
     def _create_figure(self, sync_timestamp: float, selected_feature: int):
         """Create the line plot figure for the given center index."""
-        center_idx = self.get_frame_for_toa(sync_timestamp)
-        start_idx = self.get_frame_for_toa(sync_timestamp - (self._plot_window_seconds / 2))
-        end_idx = self.get_frame_for_toa(sync_timestamp + (self._plot_window_seconds / 2))
+        half_window_s = self._plot_window_seconds / 2
+        start_idx, center_idx, end_idx = self.get_frames_for_toas(
+            (sync_timestamp - half_window_s, sync_timestamp, sync_timestamp + half_window_s)
+        )
 
         # Get data slice
         feature_name = self._features[selected_feature]
@@ -171,12 +171,8 @@ class SkeletonComponent(DataComponent):
             ref_counters = hdf5[self._ref_counter_path][:, 0]
             pos_counters = hdf5[self._pos_counter_path][:, 0]
 
-            # Create a mapping from values to their first occurrence index in position counters
-            _, first_indices = np.unique(pos_counters, return_index=True)
-            value_to_first_idx = dict(zip(pos_counters[first_indices], first_indices))
-
-            # Look up each element of reference counters
-            matches = np.array([value_to_first_idx.get(val, -1) for val in ref_counters])
+            # Look up the first occurrence of each element of reference counters
+            matches = self._match_counters(ref_counters, pos_counters)
             self._toa_s = self._toa_s[matches >= 0]
             self._positions = self._positions[matches[matches >= 0]]
 
@@ -171,9 +171,10 @@ class VideoComponent(DataComponent):
     def read_data(self):
         with h5py.File(self._hdf5_path, 'r') as hdf5:
             try:
-                self._toa_s = hdf5[self._toa_hdf5_path][:]
-                self._timestamp = hdf5[self._timestamp_hdf5_path][:]
-                self._sequence = hdf5[self._sequence_hdf5_path][:]
+                # Flat per-frame arrays, as binary searched by frame lookups
+                self._toa_s = hdf5[self._toa_hdf5_path][:].ravel()
+                self._timestamp = hdf5[self._timestamp_hdf5_path][:].ravel()
+                self._sequence = hdf5[self._sequence_hdf5_path][:].ravel()
             except Exception as e:
                 print(f'Error reading timestamps for cameras: {e}', flush=True)
 
@@ -205,21 +206,29 @@ class VideoComponent(DataComponent):
         return width, height, fps, num_frames
 
     def get_frame_for_timestamp(self, timestamp: float) -> int:
-        """Find the frame index closest to, but not later than the given timestamp."""
-        timestamp_diffs = np.abs(self._timestamp - timestamp)
-        return np.argmin(timestamp_diffs).item()
+        """Find the frame index closest to the given timestamp (binary search over the increasing frame timestamps)."""
+        idx = np.searchsorted(self._timestamp, timestamp).item()
+        if idx == 0:
+            return 0
+        if idx == len(self._timestamp):
+            return idx - 1
+        # Nearest of the two neighbors, the earlier one on ties (differences taken non-negative for unsigned timestamps).
+        if timestamp - self._timestamp[idx - 1] <= self._timestamp[idx] - timestamp:
+            # First of repeated timestamps, like `argmin`
+            return np.searchsorted(self._timestamp, self._timestamp[idx - 1]).item()
+        return idx
 
     def get_timestamp_at_frame(self, frame_id: int) -> float:
         """Get the timestamp for a given frame."""
-        return self._timestamp[frame_id].item()
+        return self._timestamp.item(frame_id)
 
     def get_toa_at_frame(self, frame_id: int) -> float:
         """Get the time-of-arrival for a given frame."""
-        return self._toa_s[frame_id].item()
+        return self._toa_s.item(frame_id)
 
     def get_sequence_at_frame(self, frame_id: int) -> int:
         """Get the aligned sequence id for a given frame."""
-        return (self._sequence[frame_id] - self._sequence[self._align_info.start_id]).item()
+        return self._sequence.item(frame_id) - self._sequence.item(self._align_info.start_id)
 
     def get_sync_info(self):
         return VideoComponentInfo(
@@ -0,0 +1,63 @@
+############
+#
+# Copyright (c) 2026 Maxim Yudayev and KU Leuven eMedia Lab
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+# Created 2024-2026 for the KU Leuven AidWear, AidFOG, and RevalExo projects
+# by Maxim Yudayev [https://yudayev.com].
+#
+# ############
+
+
+import numpy as np
+
+# Most samples sent to the browser per line trace, about the width in pixels of a full-screen plot
+MAX_TRACE_POINTS = 2000
+
+
+def downsample_minmax(
+    x: np.ndarray, y: np.ndarray, max_points: int = MAX_TRACE_POINTS
+) -> tuple[np.ndarray, np.ndarray]:
+    """Reduce a line trace to at most `max_points` samples for plotting.
+
+    Keeps the minimum and maximum of equally sized buckets of samples, in their original order,
+    so peaks of the signal stay visible (unlike with strided decimation). The first and last samples
+    are always kept for the trace to span the same time range.
+
+    Args:
+        x (np.ndarray): Sample times of the trace.
+        y (np.ndarray): Sample values of the trace, same length as `x`.
+        max_points (int): Largest number of samples to return.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The selected times and values, or the inputs when already short enough.
+    """
+    num_samples = len(y)
+    if num_samples <= max_points:
+        return x, y
+    interior = y[1:-1]
+    bucket_size = -(-len(interior) // ((max_points - 2) // 2))
+    num_buckets = -(-len(interior) // bucket_size)
+    # Repeat the last value to fill the last bucket, `argmin`/`argmax` pick its first (real) occurrence anyway
+    buckets = np.pad(interior, (0, num_buckets * bucket_size - len(interior)), mode='edge').reshape(num_buckets, -1)
+    extremes = np.sort(np.stack((buckets.argmin(axis=1), buckets.argmax(axis=1)), axis=1), axis=1)
+    indices = (extremes + np.arange(1, len(interior) + 1, bucket_size)[:, None]).ravel()
+    indices = np.concatenate(([0], indices, [num_samples - 1]))
+    return x[indices], y[indices]
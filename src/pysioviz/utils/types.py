@@ -25,8 +25,9 @@
 #
 # ############
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
+import math
 import numpy as np
 
 
@@ -63,6 +64,7 @@ class TriggerId(Enum):
     INCREMENT_10 = 'increment-10-btn'
     MAIN_SLIDER = 'frame-slider'
     FINE_SLIDER = 'fine-frame-slider'
+    FINE_SLIDER_DRAG = 'fine-slider-debounced'
     KEYBOARD = 'keyboard-event'
     TASK_START_START = 'task-start-start-btn'
     TASK_START_END = 'task-start-end-btn'
@@ -98,6 +100,64 @@ class GroundTruthLabel:
     value: str
 
 
+@dataclass(slots=True)
+class Annotation:
+    """Task transition annotation, as handled inside callbacks.
+
+    Stores hold annotations as plain dictionaries, so they are converted only when entering and leaving a callback.
+    """
+
+    id: int
+    label: str
+    task_start_start: str
+    task_start_end: str
+    task_end_start: str
+    task_end_end: str
+    edit_mode: bool = False
+    ts_start_f: float | None = field(default=None, compare=False)  # Parsed `task_start_start`, used as the sort key
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Annotation':
+        return cls(
+            data['id'],
+            data['label'],
+            data['task_start_start'],
+            data['task_start_end'],
+            data['task_end_start'],
+            data['task_end_end'],
+            data.get('edit_mode', False),
+            cls.start_key(data['task_start_start']),
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            'id': self.id,
+            'label': self.label,
+            'task_start_start': self.task_start_start,
+            'task_start_end': self.task_start_end,
+            'task_end_start': self.task_end_start,
+            'task_end_end': self.task_end_end,
+            'edit_mode': self.edit_mode,
+        }
+
+    @staticmethod
+    def start_key(task_start_start: str) -> float:
+        """Parse a start time into its sort key, start times that are not a finite number sort last."""
+        try:
+            ts_start_f = float(task_start_start)
+        except (TypeError, ValueError):
+            return math.inf
+        return ts_start_f if math.isfinite(ts_start_f) else math.inf
+
+
+@dataclass
+class AnnotationCardCache:
+    """Annotation cards rendered for one browser page, reused by its later renders of unchanged content."""
+
+    cards: dict[tuple, object] = field(default_factory=dict)  # Card by content fingerprint, of the last render only
+    rendered: tuple[tuple, list] | None = None  # Signature of the inputs of the last render and its card list
+
+
 @dataclass
 class CameraConfig:
     video_file: str